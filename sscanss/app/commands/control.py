@@ -20,10 +20,10 @@ class LockJoint(QtWidgets.QUndoCommand):
         self.model = presenter.model
 
         self.positioner_name = positioner_name
+        self.index = index
         stack = self.model.instrument.getPositioner(self.positioner_name)
-        self.old_lock_state = [link.locked for link in stack.links]
-        self.new_lock_state = self.old_lock_state.copy()
-        self.new_lock_state[index] = value
+        self.old_lock_state = stack.links[index].locked
+        self.new_lock_state = value
 
         self.setText(f'Locked Joint in {positioner_name}')
 
@@ -34,14 +34,13 @@ class LockJoint(QtWidgets.QUndoCommand):
         self.changeLockState(self.old_lock_state)
 
     def changeLockState(self, lock_state):
-        """Changes lock state of active positioning stack
+        """Changes lock state of the joint in the active positioning stack
 
-        :param lock_state: lock state for each joint in stack
-        :type lock_state: List[bool]
+        :param lock_state: lock state of the joint
+        :type lock_state: bool
         """
         stack = self.model.instrument.getPositioner(self.positioner_name)
-        for state, link in zip(lock_state, stack.links):
-            link.locked = state
+        stack.links[self.index].locked = lock_state
         self.model.instrument_controlled.emit(self.id())
 
     def mergeWith(self, command):
@@ -52,7 +51,7 @@ class LockJoint(QtWidgets.QUndoCommand):
         :return: True if merge was successful
         :rtype: bool
         """
-        if self.positioner_name != command.positioner_name:
+        if self.positioner_name != command.positioner_name or self.index != command.index:
             return False
 
         if self.old_lock_state == command.new_lock_state:
@@ -84,10 +83,10 @@ class IgnoreJointLimits(QtWidgets.QUndoCommand):
         self.model = presenter.model
 
         self.positioner_name = positioner_name
+        self.index = index
         stack = self.model.instrument.getPositioner(self.positioner_name)
-        self.old_ignore_state = [link.ignore_limits for link in stack.links]
-        self.new_ignore_state = self.old_ignore_state.copy()
-        self.new_ignore_state[index] = value
+        self.old_ignore_state = stack.links[index].ignore_limits
+        self.new_ignore_state = value
 
         self.setText(f'Ignored Joint Limits in {positioner_name}')
 
@@ -98,14 +97,13 @@ class IgnoreJointLimits(QtWidgets.QUndoCommand):
         self.changeIgnoreLimitState(self.old_ignore_state)
 
     def changeIgnoreLimitState(self, ignore_state):
-        """Changes joint limit ignore state of active positioning stack
+        """Changes limit ignore state of the joint in the active positioning stack
 
-        :param ignore_state: limit ignore state for each joint in stack
-        :type ignore_state: List[bool]
+        :param ignore_state: limit ignore state of the joint
+        :type ignore_state: bool
         """
         stack = self.model.instrument.getPositioner(self.positioner_name)
-        for state, link in zip(ignore_state, stack.links):
-            link.ignore_limits = state
+        stack.links[self.index].ignore_limits = ignore_state
         self.model.instrument_controlled.emit(self.id())
 
     def mergeWith(self, command):
@@ -116,7 +114,7 @@ class IgnoreJointLimits(QtWidgets.QUndoCommand):
         :return: True if merge was successful
         :rtype: bool
         """
-        if self.positioner_name != command.positioner_name:
+        if self.positioner_name != command.positioner_name or self.index != command.index:
             return False
 
         if self.old_ignore_state == command.new_ignore_state:
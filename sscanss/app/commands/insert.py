@@ -10,6 +10,14 @@ from sscanss.core.math import matrix_from_pose, VECTOR_EPS
 from sscanss.core.util import (Primitives, Worker, PointType, LoadVector, MessageType, StrainComponents, CommandID,
                                Attributes)
 
+_primitive_constructors = {
+    Primitives.Tube: create_tube,
+    Primitives.Sphere: create_sphere,
+    Primitives.Cylinder: create_cylinder,
+    Primitives.Cuboid: create_cuboid,
+    Primitives.Cone: create_cone
+}
+
 
 class InsertPrimitive(QtWidgets.QUndoCommand):
     """Creates command to insert specified primitive model to the project as a sample
@@ -37,18 +45,7 @@ class InsertPrimitive(QtWidgets.QUndoCommand):
 
     def redo(self):
         self.old_sample = self.presenter.model.sample
-
-        if self.primitive == Primitives.Tube:
-            mesh = create_tube(**self.args)
-        elif self.primitive == Primitives.Sphere:
-            mesh = create_sphere(**self.args)
-        elif self.primitive == Primitives.Cylinder:
-            mesh = create_cylinder(**self.args)
-        elif self.primitive == Primitives.Cuboid:
-            mesh = create_cuboid(**self.args)
-        else:
-            mesh = create_cone(**self.args)
-
+        mesh = _primitive_constructors[self.primitive](**self.args)
         self.presenter.model.addMeshToProject(mesh, self.option)
 
     def undo(self):
@@ -112,6 +109,10 @@ class InsertMeshFromFile(QtWidgets.QUndoCommand):
         # Remove the failed command from the undo_stack
         self.setObsolete(True)
         self.presenter.view.undo_stack.undo()
+        # The worker's signal connections can keep this command alive after it is
+        # removed from the stack so the references are dropped to free the memory
+        self.old_sample = None
+        self.new_mesh = None
 
 
 class InsertVolumeFromFile(QtWidgets.QUndoCommand):
@@ -188,6 +189,9 @@ class InsertVolumeFromFile(QtWidgets.QUndoCommand):
         # Remove the failed command from the undo_stack
         self.setObsolete(True)
         self.presenter.view.undo_stack.undo()
+        # The worker's signal connections can keep this command alive after it is
+        # removed from the stack so the reference is dropped to free the memory
+        self.old_sample = None
 
     def id(self):
         """Returns ID used for notifying of or merging commands"""
@@ -383,13 +387,11 @@ class DeletePoints(QtWidgets.QUndoCommand):
         :return: array with removed points inserted
         :rtype: numpy.ndarray
         """
-        for index, value in enumerate(self.indices):
-            if index < len(array):
-                array = np.insert(array, value, removed_array[index], 0)
-            else:
-                array = np.append(array, removed_array[index:index + 1], 0)
-
-        return array
+        # The sorted indices refer to positions in the array before the deletion so
+        # each is offset by the number of indices inserted before it, allowing all
+        # points to be re-inserted with a single allocation and copy
+        positions = np.asarray(self.indices) - np.arange(len(self.indices))
+        return np.insert(array, positions, removed_array, 0)
 
 
 class MovePoints(QtWidgets.QUndoCommand):
@@ -411,31 +413,37 @@ class MovePoints(QtWidgets.QUndoCommand):
         self.move_to = move_to
         self.model = presenter.model
         self.point_type = point_type
-
-        count = len(self.model.fiducials) if point_type == PointType.Fiducial else len(self.model.measurement_points)
-        self.old_order = list(range(0, count))
-        self.new_order = self.old_order.copy()
-        self.new_order[move_from], self.new_order[move_to] = self.new_order[move_to], self.new_order[move_from]
+        self.swaps = [(move_from, move_to)]
 
         self.setText(f'Change {self.point_type.value} Point Index')
 
     def redo(self):
         if self.point_type == PointType.Fiducial:
-            self.model.fiducials[self.old_order] = self.model.fiducials[self.new_order]
+            fiducials = self.model.fiducials
+            for index_from, index_to in self.swaps:
+                fiducials[[index_from, index_to]] = fiducials[[index_to, index_from]]
             self.model.notifyChange(Attributes.Fiducials)
         else:
-            self.model.measurement_points[self.old_order] = self.model.measurement_points[self.new_order]
-            self.model.measurement_vectors[self.old_order, :, :] = self.model.measurement_vectors[self.new_order, :, :]
+            points = self.model.measurement_points
+            vectors = self.model.measurement_vectors
+            for index_from, index_to in self.swaps:
+                points[[index_from, index_to]] = points[[index_to, index_from]]
+                vectors[[index_from, index_to], :, :] = vectors[[index_to, index_from], :, :]
             self.model.notifyChange(Attributes.Measurements)
             self.model.notifyChange(Attributes.Vectors)
 
     def undo(self):
         if self.point_type == PointType.Fiducial:
-            self.model.fiducials[self.new_order] = self.model.fiducials[self.old_order]
+            fiducials = self.model.fiducials
+            for index_from, index_to in reversed(self.swaps):
+                fiducials[[index_from, index_to]] = fiducials[[index_to, index_from]]
             self.model.notifyChange(Attributes.Fiducials)
         else:
-            self.model.measurement_points[self.new_order] = self.model.measurement_points[self.old_order]
-            self.model.measurement_vectors[self.new_order, :, :] = self.model.measurement_vectors[self.old_order, :, :]
+            points = self.model.measurement_points
+            vectors = self.model.measurement_vectors
+            for index_from, index_to in reversed(self.swaps):
+                points[[index_from, index_to]] = points[[index_to, index_from]]
+                vectors[[index_from, index_to], :, :] = vectors[[index_to, index_from], :, :]
             self.model.notifyChange(Attributes.Measurements)
             self.model.notifyChange(Attributes.Vectors)
 
@@ -443,11 +451,15 @@ class MovePoints(QtWidgets.QUndoCommand):
         if self.point_type != command.point_type:
             return False
 
-        move_to = command.move_to
-        move_from = command.move_from
-        self.new_order[move_from], self.new_order[move_to] = self.new_order[move_to], self.new_order[move_from]
+        self.swaps.append((command.move_from, command.move_to))
+
+        # The command is obsolete if the accumulated swaps cancel out i.e. every
+        # touched index holds its original row
+        order = {}
+        for index_from, index_to in self.swaps:
+            order[index_from], order[index_to] = order.get(index_to, index_to), order.get(index_from, index_from)
 
-        if self.new_order == self.old_order:
+        if all(key == value for key, value in order.items()):
             self.setObsolete(True)
 
         return True
@@ -720,6 +720,7 @@ class SimulationDialog(QtWidgets.QWidget):
         main_layout.addWidget(self.progress_bar)
 
         self.result_list = Accordion()
+        self.pane_result_keys = []
         main_layout.addWidget(self.result_list)
         self.setLayout(main_layout)
 
@@ -756,6 +757,7 @@ class SimulationDialog(QtWidgets.QWidget):
             self.progress_bar.setMaximum(self.simulation.count)
             self.updateProgress(SimulationDialog.State.Starting)
             self.result_list.clear()
+            self.pane_result_keys = []
             self.resetFilterButtons()
             self.simulation.result_updated.connect(self.showResult)
             self.simulation.stopped.connect(lambda: self.updateProgress(SimulationDialog.State.Stopped))
@@ -833,9 +835,7 @@ class SimulationDialog(QtWidgets.QWidget):
 
     def toggleResults(self):
         """Shows/Hides the result panes based on the filters"""
-        for i, pane in enumerate(self.result_list.panes):
-            key = self.getResultKey(self.simulation.results[i])
-            self.__updateFilterButton(key)
+        for pane, key in zip(self.result_list.panes, self.pane_result_keys):
             pane.setVisible(self.filter_button_group.button(key.value).isChecked())
 
     def getResultKey(self, result):
@@ -891,6 +891,25 @@ class SimulationDialog(QtWidgets.QWidget):
         state = SimulationDialog.State.Running if self.simulation.isRunning() else SimulationDialog.State.Stopped
         results = self.simulation.results[len(self.result_list.panes):]
 
+        # Suspend painting so a batch of new panes triggers a single repaint
+        self.result_list.setUpdatesEnabled(False)
+        try:
+            self.__addResultPanes(results, state)
+        finally:
+            self.result_list.setUpdatesEnabled(True)
+
+        if error:
+            self.updateProgress(SimulationDialog.State.Stopped)
+            self.parent.showMessage('An error occurred while running the simulation.')
+
+    def __addResultPanes(self, results, state):
+        """Creates and adds result panes for the given simulation results
+
+        :param results: simulation results
+        :type results: List[SimulationResult]
+        :param state: simulation state
+        :type state: SimulationDialog.State
+        """
         for result in results:
             header = QtWidgets.QLabel()
             header.setTextFormat(QtCore.Qt.RichText)
@@ -939,10 +958,6 @@ class SimulationDialog(QtWidgets.QWidget):
             self.result_list.addPane(self.__createPane(header, details, style, result))
             self.updateProgress(state, True)
 
-        if error:
-            self.updateProgress(SimulationDialog.State.Stopped)
-            self.parent.showMessage('An error occurred while running the simulation.')
-
     def __createPane(self, panel, details, style, result):
         """Creates an accordion pane for the simulation result
 
@@ -959,6 +974,7 @@ class SimulationDialog(QtWidgets.QWidget):
         """
         pane = Pane(panel, details, style)
         key = self.getResultKey(result)
+        self.pane_result_keys.append(key)
         self.result_counts[key] += 1
         self.__updateFilterButton(key)
         if not self.filter_button_group.button(key.value).isChecked():
@@ -1182,8 +1198,7 @@ class ScriptExportDialog(QtWidgets.QDialog):
         temp[self.template.Key.header.value] = header.replace(self.template.Key.position.value,
                                                               '\t'.join(self.results[0].joint_labels), 1)
 
-        for key in self.template.keys:
-            self.template.keys[key] = temp[key]
+        self.template.keys = {key: temp[key] for key in self.template.keys}
 
     def renderScript(self, preview=False):
         """Renders the simulation result into a script using template. For a preview,
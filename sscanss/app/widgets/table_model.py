@@ -61,13 +61,19 @@ class PointModel(QtCore.QAbstractTableModel):
         :param array: fiducial or measurement point
         :type array: numpy.recarray
         """
-        self.layoutAboutToBeChanged.emit()
+        # The layout signals force attached views to rebuild their indexes which is
+        # only needed when the number of points changes, in-place edits only need
+        # the cells repainted
+        resized = array.shape != self._data.shape
+        if resized:
+            self.layoutAboutToBeChanged.emit()
         self._data = array
         self.setHeaderIcon()
         top_left = self.index(0, 0)
         bottom_right = self.index(self.rowCount() - 1, 3)
         self.dataChanged.emit(top_left, bottom_right)
-        self.layoutChanged.emit()
+        if resized:
+            self.layoutChanged.emit()
 
     def rowCount(self, _parent=None):
         return self._data.points.shape[0]
@@ -253,7 +253,9 @@ class MainWindowModel(QObject):
         :type point_type: PointType
         """
         points, enabled = read_points(filename)
-        self.addPointsToProject(list(zip(points, enabled)), point_type)
+        # The columns are assembled into records directly since zipping into
+        # python tuples is slow for large point files
+        self.addPointsToProject(np.rec.fromarrays([points, enabled], dtype=POINT_DTYPE), point_type)
 
     def savePoints(self, filename, point_type):
         """Writes a set of points to file
@@ -432,12 +434,16 @@ class MainWindowModel(QObject):
         :param point_type: point type
         :type point_type: PointType
         """
+        # Avoids copying the input when it is already in the project point format
+        if not isinstance(points, np.recarray) or points.dtype != POINT_DTYPE:
+            points = np.rec.array(points, dtype=POINT_DTYPE)
+
         if point_type == PointType.Fiducial:
-            fiducials = np.append(self.fiducials, np.rec.array(points, dtype=POINT_DTYPE))
+            fiducials = np.append(self.fiducials, points)
             self.fiducials = fiducials.view(np.recarray)
         elif point_type == PointType.Measurement:
             size = (len(points), *self.measurement_vectors.shape[1:])
-            measurement_points = np.append(self.measurement_points, np.rec.array(points, dtype=POINT_DTYPE))
+            measurement_points = np.append(self.measurement_points, points)
             self.measurement_points = measurement_points.view(np.recarray)
             self.measurement_vectors = np.append(self.measurement_vectors, np.zeros(size), axis=0)
 
@@ -471,7 +477,9 @@ class MainWindowModel(QObject):
         """
         size = self.measurement_vectors.shape
         if alignment >= size[2]:
-            self.measurement_vectors = np.dstack(
+            # Written directly into project data so listeners get a single
+            # notification from the notifyChange below instead of one per step
+            self.project_data['measurement_vectors'] = np.dstack(
                 (self.measurement_vectors, np.zeros((size[0], size[1], alignment - size[2] + 1))))
 
         detector_index = slice(detector * 3, detector * 3 + 3)
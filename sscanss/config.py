@@ -128,7 +128,7 @@ class SettingItem:
     :type fixed_size: int
     """
     def __init__(self, default, limits=None, sub_type=None, fixed_size=False):
-        self.default = default
+        self._default = default
         self.type = type(default)
         self.sub_type = sub_type
         self.size = 0
@@ -137,6 +137,18 @@ class SettingItem:
         self.fixed_size = fixed_size
         self.limits = limits
 
+    @property
+    def default(self):
+        """Returns the default value. Mutable defaults e.g. list are copied so callers
+        cannot modify the stored default in-place
+
+        :return: default value for the setting item
+        :rtype: Any
+        """
+        if self.type in (list, bytearray):
+            return self.type(self._default)
+        return self._default
+
 
 __defaults__ = {
     Key.Geometry: SettingItem(bytearray(b'')),
@@ -175,6 +187,7 @@ class Setting:
     """
     def __init__(self):
         self.local = {}
+        self._cache = {}
         self.system = QtCore.QSettings(QtCore.QSettings.IniFormat, QtCore.QSettings.UserScope, 'SScanSS 2', 'SScanSS 2')
 
     @staticmethod
@@ -183,15 +196,21 @@ class Setting:
 
     def value(self, key):
         """Retrieves the value saved with the given key or the default value if no value is
-        saved.
+        saved. Validated values of immutable type are memoized until the key is written.
 
         :param key: setting key
         :type key: Enum
         :return: value saved with given key or default
         :rtype: Any
         """
+        if key in self._cache:
+            return self._cache[key]
+
         item = self.default(key)
-        return self.__getSafeValue(key, item)
+        value = self.__getSafeValue(key, item)
+        if item.type in (int, float, bool, str, tuple):
+            self._cache[key] = value
+        return value
 
     def __getSafeValue(self, key, item):
         """Retrieves the safe value of given key. if the value is not safe (e.g. outside bounds, wrong type etc)
@@ -264,6 +283,7 @@ class Setting:
         :type default: bool
         """
         self.local[key.value] = value
+        self._cache.pop(key, None)
         if default:
             self.system.setValue(key.value, value)
 
@@ -275,6 +295,7 @@ class Setting:
         :type default: bool
         """
         self.local.clear()
+        self._cache.clear()
         if default:
             for group in self.Group:
                 self.system.remove(group.value)
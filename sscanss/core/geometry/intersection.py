@@ -8,10 +8,170 @@ from ..math.transform import view_from_plane
 from sscanss.core.geometry.primitive import create_cuboid
 from ..math.vector import Vector3, Vector4
 
+# The native closest-triangle path uses numba rather than a hand-written C extension
+# so the package remains pure Python and needs no compiler at install time; the NumPy
+# implementation is the fallback when numba is unavailable.
+try:
+    import numba
+except ImportError:
+    numba = None
+
 eps = 0.000001
 
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _closest_triangle_kernel(v1, v21, v32, v13, nor, c21, c32, c13, dot_v21, dot_v32, dot_v13, dot_nor, centroid,
+                                 radius_sq, points, out_idx):
+        """Finds the index of the closest triangle to each point using scalar arithmetic
+        i.e. without large intermediate arrays. Operates on tables precomputed by
+        closest_triangle_to_point.
+
+        :param v1: N x 3 array of first triangle vertices
+        :type v1: numpy.ndarray
+        :param v21: N x 3 array of first edge vectors
+        :type v21: numpy.ndarray
+        :param v32: N x 3 array of second edge vectors
+        :type v32: numpy.ndarray
+        :param v13: N x 3 array of third edge vectors
+        :type v13: numpy.ndarray
+        :param nor: N x 3 array of triangle normals
+        :type nor: numpy.ndarray
+        :param c21: N x 3 array of first edge-normal cross products
+        :type c21: numpy.ndarray
+        :param c32: N x 3 array of second edge-normal cross products
+        :type c32: numpy.ndarray
+        :param c13: N x 3 array of third edge-normal cross products
+        :type c13: numpy.ndarray
+        :param dot_v21: N array of inverse squared first edge lengths
+        :type dot_v21: numpy.ndarray
+        :param dot_v32: N array of inverse squared second edge lengths
+        :type dot_v32: numpy.ndarray
+        :param dot_v13: N array of inverse squared third edge lengths
+        :type dot_v13: numpy.ndarray
+        :param dot_nor: N array of inverse squared normal lengths
+        :type dot_nor: numpy.ndarray
+        :param centroid: N x 3 array of triangle centroids
+        :type centroid: numpy.ndarray
+        :param radius_sq: N array of squared triangle bounding-sphere radii
+        :type radius_sq: numpy.ndarray
+        :param points: M x 3 array of query points
+        :type points: numpy.ndarray
+        :param out_idx: M array to write closest triangle indices into
+        :type out_idx: numpy.ndarray
+        """
+        for m in numba.prange(points.shape[0]):
+            px, py, pz = points[m, 0], points[m, 1], points[m, 2]
+            best_dist = np.inf
+            best_idx = 0
+            for n in range(v1.shape[0]):
+                # reject triangles whose bounding sphere cannot beat the current best distance
+                cx = px - centroid[n, 0]
+                cy = py - centroid[n, 1]
+                cz = pz - centroid[n, 2]
+                d_center_sq = cx * cx + cy * cy + cz * cz
+                if d_center_sq > best_dist + radius_sq[n] + 2.0 * np.sqrt(best_dist * radius_sq[n]):
+                    continue
+
+                p1x = px - v1[n, 0]
+                p1y = py - v1[n, 1]
+                p1z = pz - v1[n, 2]
+                p2x = p1x - v21[n, 0]
+                p2y = p1y - v21[n, 1]
+                p2z = p1z - v21[n, 2]
+                p3x = p1x + v13[n, 0]
+                p3y = p1y + v13[n, 1]
+                p3z = p1z + v13[n, 2]
+
+                s1 = np.sign(c21[n, 0] * p1x + c21[n, 1] * p1y + c21[n, 2] * p1z)
+                s2 = np.sign(c32[n, 0] * p2x + c32[n, 1] * p2y + c32[n, 2] * p2z)
+                s3 = np.sign(c13[n, 0] * p3x + c13[n, 1] * p3y + c13[n, 2] * p3z)
+
+                if s1 + s2 + s3 < 2.0:
+                    t = min(max((v21[n, 0] * p1x + v21[n, 1] * p1y + v21[n, 2] * p1z) * dot_v21[n], 0.0), 1.0)
+                    dx = v21[n, 0] * t - p1x
+                    dy = v21[n, 1] * t - p1y
+                    dz = v21[n, 2] * t - p1z
+                    dist = dx * dx + dy * dy + dz * dz
+
+                    t = min(max((v32[n, 0] * p2x + v32[n, 1] * p2y + v32[n, 2] * p2z) * dot_v32[n], 0.0), 1.0)
+                    dx = v32[n, 0] * t - p2x
+                    dy = v32[n, 1] * t - p2y
+                    dz = v32[n, 2] * t - p2z
+                    dist = min(dist, dx * dx + dy * dy + dz * dz)
+
+                    t = min(max((v13[n, 0] * p3x + v13[n, 1] * p3y + v13[n, 2] * p3z) * dot_v13[n], 0.0), 1.0)
+                    dx = v13[n, 0] * t - p3x
+                    dy = v13[n, 1] * t - p3y
+                    dz = v13[n, 2] * t - p3z
+                    dist = min(dist, dx * dx + dy * dy + dz * dz)
+                else:
+                    d = nor[n, 0] * p1x + nor[n, 1] * p1y + nor[n, 2] * p1z
+                    dist = d * d * dot_nor[n]
+
+                if dist < best_dist:
+                    best_dist = dist
+                    best_idx = n
+
+            out_idx[m] = best_idx
+
+
+def _row_cross(a, b):
+    """Computes row-wise cross products of two N x 3 arrays. Writing each component
+    as a contiguous multiply-subtract avoids the generic dispatch and bookkeeping of
+    np.cross
+
+    :param a: N x 3 array of vectors
+    :type a: numpy.ndarray
+    :param b: N x 3 array of vectors
+    :type b: numpy.ndarray
+    :return: N x 3 array of cross products
+    :rtype: numpy.ndarray
+    """
+    result = np.empty_like(a)
+    result[:, 0] = a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1]
+    result[:, 1] = a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2]
+    result[:, 2] = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+
+    return result
 
-def closest_triangle_to_point(faces, points):
+
+class _TriangleAccel:
+    """Precomputes the per-triangle tables used by closest_triangle_to_point so that
+    repeated queries against the same faces can amortise the setup cost
+
+    :param faces: N x 9 array of triangular face vertices
+    :type faces: numpy.ndarray
+    """
+    __slots__ = ('v1', 'v21', 'v32', 'v13', 'nor', 'c21', 'c32', 'c13', 'dot_v21', 'dot_v32', 'dot_v13', 'dot_nor',
+                 'centroid', 'radius_sq')
+
+    def __init__(self, faces):
+        # split the (N, 9) faces into three contiguous (N, 3) vertex arrays once, so
+        # every derived product streams with unit stride instead of 3-strided views
+        v1 = np.ascontiguousarray(faces[:, 0:3])
+        v2 = np.ascontiguousarray(faces[:, 3:6])
+        v3 = np.ascontiguousarray(faces[:, 6:9])
+        self.v1 = v1
+        self.v21 = v2 - v1
+        self.v32 = v3 - v2
+        self.v13 = v1 - v3
+        self.nor = _row_cross(self.v21, self.v13)
+        self.c13 = _row_cross(self.v13, self.nor)
+        self.c32 = _row_cross(self.v32, self.nor)
+        self.c21 = _row_cross(self.v21, self.nor)
+        self.dot_v21 = 1.0 / np.einsum('ij,ij->i', self.v21, self.v21)
+        self.dot_v32 = 1.0 / np.einsum('ij,ij->i', self.v32, self.v32)
+        self.dot_v13 = 1.0 / np.einsum('ij,ij->i', self.v13, self.v13)
+        self.dot_nor = 1.0 / np.einsum('ij,ij->i', self.nor, self.nor)
+        self.centroid = (v1 + v2 + v3) / 3
+        self.radius_sq = np.maximum(
+            np.einsum('ij,ij->i', v1 - self.centroid, v1 - self.centroid),
+            np.maximum(np.einsum('ij,ij->i', v2 - self.centroid, v2 - self.centroid),
+                       np.einsum('ij,ij->i', v3 - self.centroid, v3 - self.centroid)))
+
+
+def closest_triangle_to_point(faces, points, chunk_size=4096, accel=None):
     """Computes the closest face to a given 3D point. Assumes face is triangular.
     Based on code from http://www.iquilezles.org/www/articles/triangledistance/triangledistance.htm
 
@@ -19,63 +179,65 @@ def closest_triangle_to_point(faces, points):
     :type faces: numpy.ndarray
     :param points: M x 3 array of points to find closest faces
     :type points: numpy.ndarray
+    :param chunk_size: number of points per batch used to cap peak memory
+    :type chunk_size: int
+    :param accel: prebuilt triangle tables for the given faces
+    :type accel: Optional[_TriangleAccel]
     :return: M x 9 array of faces corresponding to points
     :rtype: numpy.ndarray
     """
-    result = []
+    if accel is None:
+        accel = _TriangleAccel(faces)
 
-    v1 = faces[:, 0:3]
-    v2 = faces[:, 3:6]
-    v3 = faces[:, 6:9]
-    v21 = v2 - v1
-    v32 = v3 - v2
-    v13 = v1 - v3
-    nor = np.cross(v21, v13)
-    c13 = np.cross(v13, nor)
-    c32 = np.cross(v32, nor)
-    c21 = np.cross(v21, nor)
-    dot_v21 = 1.0 / np.einsum('ij,ij->i', v21, v21)
-    dot_v32 = 1.0 / np.einsum('ij,ij->i', v32, v32)
-    dot_v13 = 1.0 / np.einsum('ij,ij->i', v13, v13)
-    dot_nor = 1.0 / np.einsum('ij,ij->i', nor, nor)
+    v1 = accel.v1
+    v21 = accel.v21
+    v32 = accel.v32
+    v13 = accel.v13
+    nor = accel.nor
+    c13 = accel.c13
+    c32 = accel.c32
+    c21 = accel.c21
+    dot_v21 = accel.dot_v21
+    dot_v32 = accel.dot_v32
+    dot_v13 = accel.dot_v13
+    dot_nor = accel.dot_nor
 
-    for point in points:
-        dist = np.zeros(v1.shape[0], v1.dtype)
+    closest_indices = np.zeros(points.shape[0], dtype=np.intp)
+    if numba is not None:
+        _closest_triangle_kernel(v1, v21, v32, v13, nor, c21, c32, c13, dot_v21, dot_v32, dot_v13, dot_nor,
+                                 accel.centroid, accel.radius_sq, np.ascontiguousarray(points, dtype=v1.dtype),
+                                 closest_indices)
+        return faces[closest_indices]
 
-        p1 = point - v1
-        p2 = point - v2
-        p3 = point - v3
+    for start in range(0, points.shape[0], chunk_size):
+        chunk = points[start:start + chunk_size]
 
-        mask = (np.sign(np.einsum('ij,ij->i', c21, p1)) + np.sign(np.einsum('ij,ij->i', c32, p2)) +
-                np.sign(np.einsum('ij,ij->i', c13, p3)))
+        p1 = chunk[:, np.newaxis, :] - v1[np.newaxis, :, :]
+        p2 = p1 - v21[np.newaxis, :, :]
+        p3 = p1 + v13[np.newaxis, :, :]
 
-        mask = mask < 2.0
+        mask = (np.sign(np.einsum('nk,mnk->mn', c21, p1, optimize=True)) +
+                np.sign(np.einsum('nk,mnk->mn', c32, p2, optimize=True)) +
+                np.sign(np.einsum('nk,mnk->mn', c13, p3, optimize=True))) < 2.0
 
-        oo = v21[mask]
-        ooo = p1[mask]
-        temp = oo * np.clip(np.einsum('ij,ij->i', oo, ooo) * dot_v21[mask], 0.0, 1.0)[:, np.newaxis] - ooo
-        temp = np.einsum('ij,ij->i', temp, temp)
+        t = np.clip(np.einsum('nk,mnk->mn', v21, p1, optimize=True) * dot_v21, 0.0, 1.0)
+        temp = v21[np.newaxis, :, :] * t[:, :, np.newaxis] - p1
+        d1 = np.einsum('mnk,mnk->mn', temp, temp, optimize=True)
 
-        oo = v32[mask]
-        ooo = p2[mask]
-        temp_2 = oo * np.clip(np.einsum('ij,ij->i', oo, ooo) * dot_v32[mask], 0.0, 1.0)[:, np.newaxis] - ooo
-        temp_2 = np.einsum('ij,ij->i', temp_2, temp_2)
+        t = np.clip(np.einsum('nk,mnk->mn', v32, p2, optimize=True) * dot_v32, 0.0, 1.0)
+        temp = v32[np.newaxis, :, :] * t[:, :, np.newaxis] - p2
+        d2 = np.einsum('mnk,mnk->mn', temp, temp, optimize=True)
 
-        oo = v13[mask]
-        ooo = p3[mask]
-        temp_3 = oo * np.clip(np.einsum('ij,ij->i', oo, ooo) * dot_v13[mask], 0.0, 1.0)[:, np.newaxis] - ooo
-        temp_3 = np.einsum('ij,ij->i', temp_3, temp_3)
+        t = np.clip(np.einsum('nk,mnk->mn', v13, p3, optimize=True) * dot_v13, 0.0, 1.0)
+        temp = v13[np.newaxis, :, :] * t[:, :, np.newaxis] - p3
+        d3 = np.einsum('mnk,mnk->mn', temp, temp, optimize=True)
 
-        inv_mask = ~mask
-        temp_4 = np.einsum('ij,ij->i', nor[inv_mask], p1[inv_mask])
-        dist[inv_mask] = temp_4 * temp_4 * dot_nor[inv_mask]
+        dn = np.einsum('nk,mnk->mn', nor, p1, optimize=True)**2 * dot_nor
 
-        dist[mask] = np.minimum(temp, np.minimum(temp_2, temp_3))
+        dist = np.where(mask, np.minimum(d1, np.minimum(d2, d3)), dn)
+        closest_indices[start:start + chunk_size] = dist.argmin(axis=1)
 
-        closest_face = faces[dist.argmin()]
-        result.append(closest_face)
-
-    return np.array(result)
+    return faces[closest_indices]
 
 
 def mesh_plane_intersection(mesh, plane):
@@ -98,48 +260,37 @@ def mesh_plane_intersection(mesh, plane):
     all_vertices = mesh.vertices[mesh.indices]
     all_dist = np.dot(all_vertices - plane.point, plane.normal)
     offsets = range(0, all_vertices.shape[0], 3)
-    gg = np.logical_and.reduceat(all_dist > 0, offsets)
-    ll = np.logical_and.reduceat(all_dist < 0, offsets)
-    indices = np.where(~ll & ~gg)[0] * 3
+    # a face misses the plane only when all three signed distances share a strict sign,
+    # i.e. when the per-face sum of signs is +3 or -3; one int8 reduction replaces the
+    # two boolean reductions over the distance array
+    sign_sum = np.add.reduceat(np.sign(all_dist).astype(np.int8), offsets)
+    indices = np.where(np.abs(sign_sum) < 3)[0]
     if indices.size == 0:
         return segments
 
-    for index in indices:
-        dist = all_dist[index:index + 3]
-        vertices = all_vertices[index:index + 3, :]
+    vertices = all_vertices.reshape(-1, 3, 3)[indices]
+    dist = all_dist.reshape(-1, 3)[indices]
 
-        points = []
-        non_zeros = np.nonzero(dist)[0]
-        if non_zeros.size == 0:
-            # all vertices on the plane we currently don't
-            # care about this condition
-            continue
-        elif non_zeros.size == 1:
-            # edge lies on the plane
-            tmp = np.delete((0, 1, 2), non_zeros[0])
-            a = vertices[tmp[0], :]
-            b = vertices[tmp[1], :]
-            segments.extend([a, b])
-            continue
-        elif non_zeros.size == 2:
-            # point lies on plane so check intersection for a single line
-            tmp = np.delete((0, 1, 2), non_zeros)
-            points.append(vertices[tmp[0], :])
-            face_indices = [(non_zeros[0], non_zeros[1])]
-        else:
-            face_indices = [(0, 1), (1, 2), (0, 2)]
-
-        for i, j in face_indices:
-            a = vertices[i, :]
-            b = vertices[j, :]
-
-            point = segment_plane_intersection(a, b, plane)
-            if point is not None:
-                points.append(point)
-
-            if len(points) == 2:
-                segments.extend([points[0], points[1]])
-                break
+    # Each crossing face yields up to six candidate points: its vertices that lie on
+    # the plane and the intersections of its edges with the plane. Faces with exactly
+    # two candidates produce a segment, which covers the edge-on-plane, vertex-on-plane
+    # and ordinary straddling cases; faces fully on the plane (three candidates) are
+    # ignored as before.
+    dist_a = dist[:, [0, 1, 0]]
+    dist_b = dist[:, [1, 2, 2]]
+    edge_start = vertices[:, [0, 1, 0], :]
+    edge_end = vertices[:, [1, 2, 2], :]
+
+    crossing = (dist_a * dist_b) < 0
+    denominator = dist_a - dist_b
+    t = np.where(crossing, dist_a / np.where(crossing, denominator, 1.0), 0.0)
+    edge_points = edge_start + t[:, :, np.newaxis] * (edge_end - edge_start)
+
+    candidates = np.concatenate((vertices, edge_points), axis=1)
+    valid = np.concatenate((dist == 0, crossing), axis=1)
+
+    pairs = np.count_nonzero(valid, axis=1) == 2
+    segments.extend(candidates[pairs][valid[pairs]])
 
     return segments
 
@@ -156,16 +307,18 @@ def segment_plane_intersection(point_a, point_b, plane):
     :return: point of intersection or None if no intersection
     :rtype: Union[numpy.ndarray, None]
     """
+    # scalar arithmetic skips the ufunc dispatch overhead of np.dot on 3-vectors
     ab = point_b - point_a
-    n = -np.dot(plane.normal, point_a - plane.point)
-    d = np.dot(plane.normal, ab)
+    normal_x, normal_y, normal_z = plane.normal
+    d = normal_x * ab[0] + normal_y * ab[1] + normal_z * ab[2]
     if -eps < d < eps:
         # ignore case where line lies on plane
         return None
-    t = n / d
+
+    offset = point_a - plane.point
+    t = -(normal_x * offset[0] + normal_y * offset[1] + normal_z * offset[2]) / d
     if 0.0 <= t <= 1.0:
-        q = point_a + t * ab
-        return q
+        return point_a + t * ab
 
     return None
 
@@ -3,12 +3,42 @@ Classes for Volume objects
 """
 from enum import Enum, unique
 import numpy as np
-from scipy.interpolate import CubicSpline, interp1d
+from functools import partial
+from scipy import fft
+from scipy.interpolate import CubicSpline
 from ..geometry.mesh import BoundingBox
 from ..geometry.primitive import create_cuboid
 from ..math.matrix import Matrix44
 
 
+_transfer_function_cache = {}
+"""Maps control-point keys to built LUTs; interactive edits frequently revisit the
+same control points (e.g. a drag and release) so the 256-sample rebuild is skipped"""
+
+
+def preintegrate_transfer_function(transfer_function):
+    """Builds a pre-integrated transfer function table from a flattened 256 x 4 RGBA
+    lookup table. Entry (i, j) holds the average colour and alpha of the transfer
+    function between intensities i and j, so the volume raymarcher can apply a whole
+    ray segment with a single 2D texture sample instead of integrating per step.
+
+    :param transfer_function: flattened 256 x 4 RGBA transfer function
+    :type transfer_function: numpy.ndarray
+    :return: 256 x 256 x 4 pre-integrated RGBA table
+    :rtype: numpy.ndarray[numpy.float32]
+    """
+    tf = transfer_function.reshape(256, 4).astype(np.float32) / 255
+    cumulative = np.cumsum(tf, axis=0, dtype=np.float32)
+
+    index = np.arange(256)
+    lo = np.minimum.outer(index, index)
+    hi = np.maximum.outer(index, index)
+
+    # inclusive sum of the samples between the two intensities divided by the count
+    segment_sum = cumulative[hi] - cumulative[lo] + tf[lo]
+    return segment_sum / (hi - lo + 1)[..., np.newaxis].astype(np.float32)
+
+
 class Curve:
     """Creates a Curve object used to generate transfer function for volumes
 
@@ -34,16 +64,30 @@ class Curve:
         self.type = curve_type
         self.f = None
 
-        self.transfer_function = np.tile(np.linspace(0.0, 1.0, num=256, dtype=np.float32)[:, None], (1, 4))
         if len(inputs) > 1:
             if curve_type == self.Type.Cubic:
                 self.f = CubicSpline(inputs, outputs)
             else:
-                self.f = interp1d(inputs, outputs, kind='linear', bounds_error=False, assume_sorted=True)
-
-        value = self.evaluate(np.linspace(bounds[0], bounds[-1], num=256))
-        self.transfer_function[:, 3] = value
-        self.transfer_function = self.transfer_function.flatten()
+                # np.interp is a single C pass and avoids the interp1d object machinery
+                self.f = partial(np.interp, xp=inputs, fp=outputs)
+
+        key = (inputs.tobytes(), outputs.tobytes(), float(bounds[0]), float(bounds[-1]), curve_type)
+        cached = _transfer_function_cache.get(key)
+        if cached is not None:
+            self.transfer_function = cached.copy()
+            return
+
+        # the flat buffer is allocated once and filled in place via a (256, 4) view,
+        # avoiding the tile and flatten copies. The LUT is quantised to uint8 RGBA since
+        # the GPU samples it as an 8-bit texture anyway, quartering the upload size
+        self.transfer_function = np.empty(256 * 4, np.uint8)
+        view = self.transfer_function.reshape(256, 4)
+        view[:, :3] = np.arange(256, dtype=np.uint8)[:, None]
+        view[:, 3] = (self.evaluate(np.linspace(bounds[0], bounds[-1], num=256)) * 255 + 0.5).astype(np.uint8)
+
+        if len(_transfer_function_cache) > 128:
+            _transfer_function_cache.clear()
+        _transfer_function_cache[key] = self.transfer_function.copy()
 
     def evaluate(self, inputs):
         """Computes the outputs alpha values for the input intensity
@@ -54,12 +98,13 @@ class Curve:
         :rtype: numpy.ndarray
         """
         if self.f is None:
-            outputs = np.clip(np.full(len(inputs), self.outputs[0]), 0.0, 1.0)
+            outputs = np.full(len(inputs), np.clip(self.outputs[0], 0.0, 1.0))
         else:
-            outputs = np.clip(self.f(inputs), 0.0, 1.0)
+            outputs = np.asarray(self.f(inputs))
+            np.clip(outputs, 0.0, 1.0, out=outputs)
 
-        outputs[inputs < self.inputs[0]] = self.outputs[0]
-        outputs[inputs > self.inputs[-1]] = self.outputs[-1]
+        np.copyto(outputs, self.outputs[0], where=inputs < self.inputs[0])
+        np.copyto(outputs, self.outputs[-1], where=inputs > self.inputs[-1])
 
         return outputs
 
@@ -83,14 +128,35 @@ class Volume:
 
         self.voxel_size = voxel_size
         self.transform_matrix = Matrix44.fromTranslation(centre)
-        self.bounding_box = BoundingBox(self.extent / 2, -self.extent / 2)
-        self.bounding_box = self.bounding_box.transform(self.transform_matrix)
+        self._local_bounding_box = BoundingBox(self.extent / 2, -self.extent / 2)
+        self._bounding_box = None
         self.render_target = data if binned_data is None else binned_data
-        self.histogram = histogram if histogram is not None else np.histogram(self.render_target, 256, (0, 255))
+        if histogram is not None:
+            self.histogram = histogram
+        elif self.render_target.dtype == np.uint8:
+            # for uint8 data the 256-bin histogram is a plain bincount, which skips the
+            # float conversion and bin-edge arithmetic done by np.histogram
+            self.histogram = (np.bincount(self.render_target.ravel(order='K'), minlength=256), np.linspace(0, 255, 257))
+        else:
+            self.histogram = np.histogram(self.render_target, 256, (0, 255))
         inputs = np.array([self.histogram[1][0], self.histogram[1][-1]])
         outputs = np.array([0.0, 1.0])
         self.curve = Curve(inputs, outputs, inputs, Curve.Type.Cubic)
 
+    @property
+    def bounding_box(self):
+        """Returns the axis-aligned bounding box of the transformed volume. The box is
+        derived lazily from the fixed local extents and the current transform matrix, so
+        repeated transforms neither inflate the box nor accumulate numerical drift
+
+        :return: bounding box
+        :rtype: BoundingBox
+        """
+        if self._bounding_box is None:
+            self._bounding_box = self._local_bounding_box.transform(self.transform_matrix)
+
+        return self._bounding_box
+
     @property
     def shape(self):
         """Returns shape of volume
@@ -135,7 +201,29 @@ class Volume:
         :type matrix: Union[numpy.ndarray, Matrix44]
         """
         self.transform_matrix = matrix @ self.transform_matrix
-        self.bounding_box = self.bounding_box.transform(matrix)
+        self._bounding_box = None
+
+    def binFFT(self, new_shape):
+        """Downsamples the volume data to the given shape by cropping in the Fourier
+        domain, which is equivalent to sinc resampling for band-limited data. Slower
+        than nearest-neighbour binning but avoids aliasing, so it is suited to
+        higher-quality previews.
+
+        :param new_shape: number of voxels in the x, y, and z axes of the result
+        :type new_shape: Tuple[int, int, int]
+        :return: binned volume data
+        :rtype: numpy.ndarray[uint8]
+        """
+        spectrum = fft.rfftn(self.data.astype(np.float32), workers=-1)
+        for axis, size in enumerate(new_shape[:2]):
+            keep = np.concatenate((np.arange((size + 1) // 2), np.arange(-(size // 2), 0)))
+            spectrum = np.take(spectrum, keep, axis=axis)
+        spectrum = spectrum[:, :, :new_shape[2] // 2 + 1]
+
+        scale = np.prod(new_shape) / np.prod(self.data.shape)
+        binned = fft.irfftn(spectrum, s=new_shape, workers=-1) * scale
+
+        return np.clip(binned, 0, 255).astype(np.uint8)
 
     def asMesh(self):
         """Creates a mesh from the bounds of the volume"""
@@ -451,6 +451,8 @@ class IKResult:
     :param orient_err_ok: flag indicates if orientation error is within tolerance
     :type orient_err_ok: bool
     """
+    __slots__ = ('q', 'status', 'position_error', 'position_converged', 'orientation_error', 'orientation_converged')
+
     def __init__(self, q, status, pos_err, orient_err, pos_err_ok, orient_err_ok):
         self.q = q
         self.status = status
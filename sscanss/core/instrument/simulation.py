@@ -203,6 +203,9 @@ class SimulationResult:
     :param note: note about result such as reason for skipping
     :type note: str
     """
+    __slots__ = ('id', 'ik', 'alignment', 'joint_labels', 'formatted', 'path_length', 'collision_mask', 'skipped',
+                 'note')
+
     def __init__(self,
                  result_id,
                  ik=None,
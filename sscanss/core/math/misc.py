@@ -19,7 +19,11 @@ def clamp(value, min_value=0.0, max_value=1.0):
     :return: number clamped between the specified range
     :rtype: float
     """
-    return max(min(value, max_value), min_value)
+    if value < min_value:
+        return min_value
+    if value > max_value:
+        return max_value
+    return value
 
 
 def map_range(old_min, old_max, new_min, new_max, value):
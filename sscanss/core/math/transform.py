@@ -10,6 +10,59 @@ from .vector import Vector3
 from .matrix import Matrix33, Matrix44
 from .misc import clamp, is_close
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _xyz_eulers_kernel(matrix, out):
+    """Extracts XYZ Euler angles in radians from a 3 x 3 rotation matrix into out"""
+    if 1 > matrix[0, 2] > -1:
+        out[1] = math.asin(matrix[0, 2])
+        out[2] = math.atan2(-matrix[0, 1], matrix[0, 0])
+        out[0] = math.atan2(-matrix[1, 2], matrix[2, 2])
+    elif matrix[0, 2] >= 1:
+        out[2] = 0.0
+        out[0] = math.atan2(matrix[1, 0], matrix[1, 1])
+        out[1] = math.pi / 2
+    else:
+        out[2] = 0.0
+        out[0] = -math.atan2(matrix[1, 0], matrix[1, 1])
+        out[1] = -math.pi / 2
+
+
+def _matrix_from_xyz_eulers_kernel(angles, out):
+    """Writes the rotation matrix for the given XYZ Euler angles in radians into out"""
+    sx = math.sin(angles[0])
+    cx = math.cos(angles[0])
+    sy = math.sin(angles[1])
+    cy = math.cos(angles[1])
+    sz = math.sin(angles[2])
+    cz = math.cos(angles[2])
+
+    sx_sy = sx * sy
+    cx_sy = cx * sy
+    out[0, 0] = cy * cz
+    out[0, 1] = -cy * sz
+    out[0, 2] = sy
+    out[1, 0] = cz * sx_sy + cx * sz
+    out[1, 1] = cx * cz - sx_sy * sz
+    out[1, 2] = -cy * sx
+    out[2, 0] = -cz * cx_sy + sx * sz
+    out[2, 1] = cz * sx + cx_sy * sz
+    out[2, 2] = cx * cy
+
+
+if numba is not None:
+    # these scalar kernels run per mouse-move during interactive rotation; cache=True
+    # persists the compiled code across runs and the warm-up calls move the one-off
+    # dispatch cost to import time instead of the first rotation
+    _xyz_eulers_kernel = numba.njit(cache=True)(_xyz_eulers_kernel)
+    _matrix_from_xyz_eulers_kernel = numba.njit(cache=True)(_matrix_from_xyz_eulers_kernel)
+    _xyz_eulers_kernel(np.eye(3), np.empty(3))
+    _matrix_from_xyz_eulers_kernel(np.zeros(3), np.empty((3, 3)))
+
 
 def view_from_plane(plane_normal):
     """Computes the matrix for viewing a plane from its normal
@@ -140,20 +193,10 @@ def xyz_eulers_from_matrix(matrix):
     :return: XYZ Euler angles in radians
     :rtype: Vector3
     """
-    if 1 > matrix[0, 2] > -1:
-        theta_y = math.asin(matrix[0, 2])
-        theta_z = math.atan2(-matrix[0, 1], matrix[0, 0])
-        theta_x = math.atan2(-matrix[1, 2], matrix[2, 2])
-    elif matrix[0, 2] >= 1:
-        theta_z = 0.0
-        theta_x = math.atan2(matrix[1, 0], matrix[1, 1])
-        theta_y = math.pi / 2
-    else:
-        theta_z = 0.0
-        theta_x = -math.atan2(matrix[1, 0], matrix[1, 1])
-        theta_y = -math.pi / 2
+    angles = np.empty(3)
+    _xyz_eulers_kernel(np.asarray(matrix, dtype=float), angles)
 
-    return Vector3([theta_x, theta_y, theta_z])
+    return Vector3(angles)
 
 
 def matrix_from_xyz_eulers(angles):
@@ -164,34 +207,10 @@ def matrix_from_xyz_eulers(angles):
     :return: rotation matrix
     :rtype: Matrix33
     """
-    sx = math.sin(angles[0])
-    cx = math.cos(angles[0])
-    sy = math.sin(angles[1])
-    cy = math.cos(angles[1])
-    sz = math.sin(angles[2])
-    cz = math.cos(angles[2])
+    matrix = np.empty((3, 3))
+    _matrix_from_xyz_eulers_kernel(np.asarray(angles, dtype=float), matrix)
 
-    return Matrix33(
-        np.array([
-            # m1
-            [
-                cy * cz,
-                -cy * sz,
-                sy,
-            ],
-            # m2
-            [
-                cz * sx * sy + cx * sz,
-                cx * cz - sx * sy * sz,
-                -cy * sx,
-            ],
-            # m3
-            [
-                -cx * cz * sy + sx * sz,
-                cz * sx + cx * sy * sz,
-                cx * cy,
-            ]
-        ]))
+    return Matrix33(matrix)
 
 
 def matrix_from_zyx_eulers(angles):
@@ -0,0 +1,46 @@
+"""
+Cache of OpenGL binding state used to skip redundant driver calls
+"""
+from OpenGL import GL
+
+_gl_state = {}
+
+
+def reset():
+    """Clears the cached bindings. This must be called whenever the OpenGL context is
+    created or recreated since the cache would otherwise describe the old context"""
+    _gl_state.clear()
+
+
+def bind_texture(unit, target, texture):
+    """Binds a texture to the given texture unit, skipping the driver call when the
+    texture is already bound to that unit
+
+    :param unit: texture unit
+    :type unit: GL.Constant
+    :param texture: texture id, zero releases the binding
+    :type texture: int
+    :param target: texture target e.g. GL_TEXTURE_3D
+    :type target: GL.Constant
+    """
+    key = (int(unit), int(target))
+    if _gl_state.get(key) == texture:
+        return
+
+    _gl_state[key] = texture
+    GL.glActiveTexture(unit)
+    GL.glBindTexture(target, texture)
+
+
+def use_program(program):
+    """Installs a program as part of the current rendering state, skipping the driver
+    call when the program is already active
+
+    :param program: program id, zero releases the active program
+    :type program: int
+    """
+    if _gl_state.get('program') == program:
+        return
+
+    _gl_state['program'] = program
+    GL.glUseProgram(program)
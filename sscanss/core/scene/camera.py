@@ -3,6 +3,7 @@ Class and functions for scene camera
 """
 import math
 from enum import unique, Enum
+import numpy as np
 from ..math.misc import clamp
 from ..math.matrix import Matrix44, Matrix33
 from ..math.transform import angle_axis_to_matrix
@@ -85,15 +86,17 @@ def get_arcball_vector(x, y):
     :type x: float
     :param y: y coordinate of point on screen
     :type y: float
-    :return: arcball vector
-    :rtype: Vector3
+    :return: unit arcball vector
+    :rtype: numpy.ndarray
     """
-    vec = Vector3([x - 1.0, 1.0 - y, 0])
-    distance = vec.x * vec.x + vec.y * vec.y
+    vec = np.array([x - 1.0, 1.0 - y, 0.0])
+    distance = vec[0] * vec[0] + vec[1] * vec[1]
     if distance <= 1:
-        vec.z = math.sqrt(1 - distance)
+        # the z component completes the unit vector so no normalisation is needed
+        vec[2] = math.sqrt(1 - distance)
+        return vec
 
-    return vec.normalized
+    return vec / math.sqrt(distance)
 
 
 class Camera:
@@ -108,6 +111,9 @@ class Camera:
     :param up: Initial up vector
     :type up: Union[List[float], None]
     """
+    __slots__ = ('mode', 'z_near', 'z_far', 'z_depth', 'moving_z_plane', 'aspect', 'fov', 'initial_target',
+                 'initial_radius', 'position', 'target', 'rot_matrix', 'model_view', 'distance', 'direction', 'up')
+
     @unique
     class Projection(Enum):
         """Camera projection types"""
@@ -212,44 +218,37 @@ class Camera:
         """
         self.position = position
         self.target = target
-        self.model_view = Matrix44.identity()
 
         if position == target:
             self.model_view = Matrix44.fromTranslation(-position)
             self.rot_matrix = Matrix33.identity()
             return
 
-        up = up_dir
-
-        forward = position - target
-        self.distance = forward.length
+        # plain ndarray arithmetic avoids the per-component attribute access of the
+        # vector wrappers, this runs on every mouse event so the difference is felt
+        forward = np.subtract(position, target, dtype=float)
+        self.distance = math.sqrt(forward @ forward)
+        forward /= self.distance
 
-        forward.normalize()
-
-        if up is None:
-            if math.fabs(forward.x) < eps and math.fabs(forward.z) < eps:
-                up = Vector3([0, 0, -1]) if forward.y > 0 else Vector3([0, 0, 1])
+        if up_dir is None:
+            if math.fabs(forward[0]) < eps and math.fabs(forward[2]) < eps:
+                up = np.array([0., 0., -1.]) if forward[1] > 0 else np.array([0., 0., 1.])
             else:
-                up = Vector3([0, 1, 0])
-
-        left = up ^ forward  # cross product
-        left.normalize()
-
-        up = forward ^ left
+                up = np.array([0., 1., 0.])
+        else:
+            up = np.array(up_dir, float)
 
-        self.rot_matrix.r1 = left
-        self.rot_matrix.r2 = up
-        self.rot_matrix.r3 = forward
+        left = np.cross(up, forward)
+        left /= math.sqrt(left @ left)
+        up = np.cross(forward, left)
 
-        self.model_view.r1[:3] = left
-        self.model_view.r2[:3] = up
-        self.model_view.r3[:3] = forward
+        rotation = np.array([left, up, forward])
+        model_view = np.identity(4)
+        model_view[:3, :3] = rotation
+        model_view[:3, 3] = rotation @ np.negative(position)
 
-        trans = Vector3()
-        trans.x = left.x * -position.x + left.y * -position.y + left.z * -position.z
-        trans.y = up.x * -position.x + up.y * -position.y + up.z * -position.z
-        trans.z = forward.x * -position.x + forward.y * -position.y + forward.z * -position.z
-        self.model_view.c4[:3] = trans
+        self.rot_matrix = Matrix33(rotation)
+        self.model_view = Matrix44(model_view)
 
     def pan(self, delta_x, delta_y):
         """Tilts the camera viewing axis vertically and/or horizontally while maintaining
@@ -262,15 +261,17 @@ class Camera:
         :type delta_y: float
         """
 
-        camera_left = Vector3([self.model_view.m11, self.model_view.m12, self.model_view.m13])
-        camera_up = Vector3([self.model_view.m21, self.model_view.m22, self.model_view.m23])
+        model_view = np.asarray(self.model_view)
+        camera_left = model_view[0, :3]
+        camera_up = model_view[1, :3]
 
         # delta is scaled by distance so pan is larger when object is farther
         distance = self.distance if self.distance >= 1.0 else 1
         offset = (delta_x * camera_left - delta_y * camera_up) * distance
 
-        new_target = self.target + offset
-        z_shift = (new_target - self.initial_target).length
+        new_target = Vector3(np.add(self.target, offset))
+        shift = np.subtract(new_target, self.initial_target)
+        z_shift = math.sqrt(shift @ shift)
         temp = 2 * (self.initial_radius + z_shift)
         self.moving_z_plane += (self.z_depth - temp) / 2
         self.z_depth = temp
@@ -295,11 +296,12 @@ class Camera:
             va = get_arcball_vector(x1, y1)
             vb = get_arcball_vector(x2, y2)
 
-            angle = math.acos(clamp(va | vb, -1.0, 1.0))
+            angle = math.acos(clamp(float(va @ vb), -1.0, 1.0))
             if abs(angle) < eps:
                 return
 
-            axis = (va ^ vb).normalized
+            axis = np.cross(va, vb)
+            axis /= math.sqrt(axis @ axis)
             self.rot_matrix = angle_axis_to_matrix(angle, axis) @ self.rot_matrix
             self.computeModelViewMatrix()
 
@@ -326,27 +328,17 @@ class Camera:
 
     def computeModelViewMatrix(self):
         """Computes the model view matrix of camera"""
-        target = self.target
         dist = self.distance
-        rot = self.rot_matrix
-
-        left = Vector3([rot.m11, rot.m21, rot.m31])
-        up = Vector3([rot.m12, rot.m22, rot.m32])
-        forward = Vector3([rot.m13, rot.m23, rot.m33])
+        rotation = np.array(self.rot_matrix)
+        target = np.array(self.target, float)
 
-        trans = Vector3()
-        trans.x = left.x * -target.x + up.x * -target.y + forward.x * -target.z
-        trans.y = left.y * -target.x + up.y * -target.y + forward.y * -target.z
-        trans.z = left.z * -target.x + up.z * -target.y + forward.z * -target.z - dist
-
-        self.model_view = Matrix44.identity()
-        self.model_view.c1[:3] = left
-        self.model_view.c2[:3] = up
-        self.model_view.c3[:3] = forward
-        self.model_view.c4[:3] = trans
+        model_view = np.identity(4)
+        model_view[:3, :3] = rotation
+        model_view[:3, 3] = rotation @ -target
+        model_view[2, 3] -= dist
 
-        forward = Vector3([-self.model_view.m31, -self.model_view.m32, -self.model_view.m33])
-        self.position = target - (dist * forward)
+        self.model_view = Matrix44(model_view)
+        self.position = Vector3(target + dist * rotation[2])
 
     @property
     def perspective(self):
@@ -62,16 +62,16 @@ class FiducialEntity(Entity):
     def __init__(self, fiducials, visible=True):
         super().__init__()
         self.visible = visible
-        self.colours = []
-        self.transforms = []
         size = settings.value(settings.Key.Fiducial_Size)
 
         enabled_colour = Colour(*settings.value(settings.Key.Fiducial_Colour))
         disabled_colour = Colour(*settings.value(settings.Key.Fiducial_Disabled_Colour))
-        for point, enabled in fiducials:
-            colour = enabled_colour if enabled else disabled_colour
-            self.transforms.append(Matrix44.fromTranslation(point))
-            self.colours.append(colour)
+        self.colours = []
+        self.transforms = []
+        if len(fiducials) > 0:
+            # Field-wise access avoids creating a record object for every point
+            self.colours = [enabled_colour if enabled else disabled_colour for enabled in fiducials['enabled']]
+            self.transforms = [Matrix44.fromTranslation(point) for point in fiducials['points']]
 
         fiducial_mesh = create_sphere(size, 32, 32)
         self.vertices = fiducial_mesh.vertices
@@ -113,15 +113,15 @@ class MeasurementPointEntity(Entity):
 
         super().__init__()
         self.visible = visible
-        self.colours = []
-        self.transforms = []
         enabled_colour = Colour(*settings.value(settings.Key.Measurement_Colour))
         disabled_colour = Colour(*settings.value(settings.Key.Measurement_Disabled_Colour))
         size = settings.value(settings.Key.Measurement_Size)
-        for point, enabled in points:
-            colour = enabled_colour if enabled else disabled_colour
-            self.transforms.append(Matrix44.fromTranslation(point))
-            self.colours.append(colour)
+        self.colours = []
+        self.transforms = []
+        if len(points) > 0:
+            # Field-wise access avoids creating a record object for every point
+            self.colours = [enabled_colour if enabled else disabled_colour for enabled in points['enabled']]
+            self.transforms = [Matrix44.fromTranslation(point) for point in points['points']]
 
         self.vertices = np.array(
             [[-size, 0., 0.], [size, 0., 0.], [0., -size, 0.], [0., size, 0.], [0., 0., -size], [0., 0., size]],
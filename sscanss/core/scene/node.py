@@ -7,11 +7,12 @@ from enum import Enum, unique
 import numpy as np
 from OpenGL import GL
 from PyQt5 import QtGui
-from .shader import VertexArray, Texture1D, Texture3D, Text3D
+from .shader import VertexArray, Texture2D, Texture3D, Text3D
 from ..math.matrix import Matrix44
 from ..geometry.colour import Colour
 from ..geometry.mesh import BoundingBox
 from ..geometry.primitive import create_cuboid
+from ..geometry.volume import preintegrate_transfer_function
 from ...config import settings
 
 
@@ -275,10 +276,10 @@ class Node:
         elif mode == Node.RenderMode.Wireframe:
             GL.glPolygonMode(GL.GL_FRONT_AND_BACK, GL.GL_LINE)
 
-        program = renderer.shader_programs['default']
+        program = renderer.shaderProgram('default')
         if self.vertices.size > 0 and self.indices.size > 0:
             if self.normals.size > 0:
-                program = renderer.shader_programs['mesh']
+                program = renderer.shaderProgram('mesh')
 
             program.bind()
             self.buffer.bind()
@@ -314,7 +315,7 @@ class Node:
         if self.outlined:
             self.drawOutline(primitive, self.buffer.count)
 
-        GL.glDrawElements(primitive, self.buffer.count, GL.GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        GL.glDrawElements(primitive, self.buffer.count, self.buffer.index_type, ctypes.c_void_p(0))
 
     def drawOutline(self, primitive, count, offset=0):
         """Renders the red outline of the bound vertex array
@@ -335,7 +336,7 @@ class Node:
         GL.glCullFace(GL.GL_FRONT)
         GL.glEnable(GL.GL_CULL_FACE)
         # First Pass
-        GL.glDrawElements(primitive, count, GL.GL_UNSIGNED_INT, ctypes.c_void_p(offset))
+        GL.glDrawElements(primitive, count, self.buffer.index_type, ctypes.c_void_p(offset))
 
         GL.glColor4dv(old_colour)
         GL.glLineWidth(old_line_width)
@@ -410,12 +411,12 @@ class BatchRenderNode(Node):
                 offset = 0
             else:
                 count = end - start
-                offset = start * self.vertices.itemsize
+                offset = start * self.buffer.index_size
 
             if self.outlined[index]:
                 self.drawOutline(primitive, count, offset)
 
-            GL.glDrawElements(primitive, count, GL.GL_UNSIGNED_INT, ctypes.c_void_p(offset))
+            GL.glDrawElements(primitive, count, self.buffer.index_type, ctypes.c_void_p(offset))
             GL.glPopMatrix()
             start = end
 
@@ -432,7 +433,7 @@ class VolumeNode(Node):
         self.render_primitive = Node.RenderPrimitive.Volume
 
         self.volume = Texture3D(volume.render_target)
-        self.transfer_function = Texture1D(volume.curve.transfer_function)
+        self.transfer_function = Texture2D(preintegrate_transfer_function(volume.curve.transfer_function))
 
         volume_mesh = create_cuboid(2, 2, 2)
         self.vertices = volume_mesh.vertices
@@ -446,7 +447,7 @@ class VolumeNode(Node):
 
     def updateTransferFunction(self, transfer_function):
         """Updates node transfer function"""
-        self.transfer_function = Texture1D(transfer_function)
+        self.transfer_function = Texture2D(preintegrate_transfer_function(transfer_function))
 
     @property
     def top(self):
@@ -513,7 +514,8 @@ class VolumeNode(Node):
         elif mode == Node.RenderMode.Wireframe:
             GL.glBlendFunc(GL.GL_ONE_MINUS_SRC_ALPHA, GL.GL_SRC_ALPHA)
 
-        program = renderer.shader_programs['volume']
+        highlight = self.selected or self.outlined
+        program = renderer.shaderProgram('volume_highlight' if highlight else 'volume')
         program.bind()
         self.buffer.bind()
         self.volume.bind(GL.GL_TEXTURE0)
@@ -524,22 +526,15 @@ class VolumeNode(Node):
 
         align_transform = self.transform
         view_matrix = np.array(renderer.scene.camera.model_view @ align_transform, np.float32)
-        focal_length = 1 / np.tan(np.pi / 180 * renderer.scene.camera.fov / 2)
         inverse_view_proj = np.linalg.inv(renderer.scene.camera.projection @ view_matrix)
         ratio = renderer.devicePixelRatioF()
 
-        program.setUniform('view', view_matrix, transpose=True)
         program.setUniform('inverse_view_proj', inverse_view_proj, transpose=True)
-        program.setUniform('aspect_ratio', renderer.scene.camera.aspect)
-        program.setUniform('focal_length', focal_length)
         program.setUniform('viewport_size', [renderer.width() * ratio, renderer.height() * ratio])
         program.setUniform('top', self.top)
         program.setUniform('bottom', self.bottom)
-        program.setUniform('step_length', 0.001)
-        program.setUniform('gamma', 2.2)
         program.setUniform('volume', 0)
         program.setUniform('transfer_func', 1)
-        program.setUniform('highlight', self.selected or self.outlined)
 
         self.buffer.bind()
         self._drawHelper(GL.GL_TRIANGLES)
@@ -566,7 +561,7 @@ class VolumeNode(Node):
         if self.outlined:
             GL.glColor4f(1, 0, 0, 1)
 
-        GL.glDrawElements(primitive, self.buffer.count, GL.GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        GL.glDrawElements(primitive, self.buffer.count, self.buffer.index_type, ctypes.c_void_p(0))
 
     def drawOutline(self, primitive, count, offset=0):
         raise NotImplementedError('drawOutline is not implemented for VolumeNode')
@@ -624,7 +619,7 @@ class TextNode(Node):
         if not self.visible and self.buffer is None:
             return
 
-        program = renderer.shader_programs['text']
+        program = renderer.shaderProgram('text')
         program.bind()
         self.buffer.bind()
         program.setUniform('viewport_size', [renderer.width(), renderer.height()])
@@ -6,6 +6,7 @@ from .camera import Camera, world_to_screen, screen_to_world
 from .node import Node, BatchRenderNode, TextNode
 from .scene import Scene
 from .shader import DefaultShader, GouraudShader, VolumeShader, TextShader
+from . import _gl_state
 from ..geometry.colour import Colour
 from ..math.matrix import Matrix44
 from ..math.vector import Vector3
@@ -32,6 +33,7 @@ class OpenGLRenderer(QtWidgets.QOpenGLWidget):
         self.error = False
         self.custom_error_handler = None
         self.shader_programs = {}
+        self._shader_factories = {}
         self.gpu_info = {'vendor': '', 'version': '', 'pbo_support': False}
 
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
@@ -45,6 +47,8 @@ class OpenGLRenderer(QtWidgets.QOpenGLWidget):
 
     def initializeGL(self):
         try:
+            # bindings cached from a previous context are meaningless in the new one
+            _gl_state.reset()
             GL.glClearColor(*Colour.white())
             GL.glColor4f(*Colour.black())
 
@@ -53,11 +57,19 @@ class OpenGLRenderer(QtWidgets.QOpenGLWidget):
             GL.glEnable(GL.GL_MULTISAMPLE)
 
             number_of_lights = self.initLights()
-            # Create and compile GLSL shaders program
-            self.shader_programs['mesh'] = GouraudShader(number_of_lights)
-            self.shader_programs['default'] = DefaultShader()
-            self.shader_programs['text'] = TextShader()
-            self.shader_programs['volume'] = VolumeShader()
+            # Create and compile GLSL shaders program. The volume programs are the
+            # costliest to compile and only needed once a volume is in the scene, so
+            # they are deferred until first requested by shaderProgram()
+            self.shader_programs.clear()
+            self._shader_factories = {
+                'mesh': lambda: GouraudShader(number_of_lights),
+                'default': DefaultShader,
+                'text': TextShader,
+                'volume': VolumeShader,
+                'volume_highlight': lambda: VolumeShader(highlight=True)
+            }
+            for key in ('mesh', 'default', 'text'):
+                self.shaderProgram(key)
 
             self.context().aboutToBeDestroyed.connect(self.cleanup)
 
@@ -76,6 +88,21 @@ class OpenGLRenderer(QtWidgets.QOpenGLWidget):
                                     'The software will be closed now.')
             raise
 
+    def shaderProgram(self, key):
+        """Returns the shader program with the given key, compiling it on first use
+
+        :param key: name of shader program
+        :type key: str
+        :return: shader program
+        :rtype: Shader
+        """
+        program = self.shader_programs.get(key)
+        if program is None:
+            program = self._shader_factories[key]()
+            self.shader_programs[key] = program
+
+        return program
+
     def reportError(self, exception):
         message = ("This device has insufficient memory for rendering the volume. "
                    "A simple mesh representation will be rendered instead.\n\n"
@@ -49,8 +49,8 @@ class Scene:
         :rtype: List[Node]
         """
         nodes = self._data.values()
-        render_mode = self._data.get(Attributes.Sample, Node()).render_mode
-        if render_mode == Node.RenderMode.Transparent:
+        sample_node = self._data.get(Attributes.Sample)
+        if sample_node is not None and sample_node.render_mode == Node.RenderMode.Transparent:
             nodes = reversed(nodes)
         return list(nodes)
 
@@ -115,6 +115,17 @@ class Scene:
     def __getitem__(self, key):
         return self._data.get(key, Node())
 
+    def get(self, key):
+        """Gets the node with the specified key, unlike indexing this returns
+        None instead of an empty node when the key is absent
+
+        :param key: key of the node
+        :type key: Any
+        :return: node or None if key is absent
+        :rtype: Union[Node, None]
+        """
+        return self._data.get(key)
+
 
 class SceneManager(QtCore.QObject):
     """Manages the instrument and sample scene and draws the active scene in the
@@ -238,10 +249,10 @@ class SceneManager(QtCore.QObject):
         :type render_mode: Node.RenderMode
         """
         self.sample_render_mode = render_mode
-        if Attributes.Sample in self.sample_scene:
-            self.sample_scene[Attributes.Sample].render_mode = render_mode
-        if Attributes.Sample in self.instrument_scene:
-            self.instrument_scene[Attributes.Sample].render_mode = render_mode
+        for scene in (self.sample_scene, self.instrument_scene):
+            node = scene.get(Attributes.Sample)
+            if node is not None:
+                node.render_mode = render_mode
 
         self.drawActiveScene(False)
 
@@ -254,10 +265,10 @@ class SceneManager(QtCore.QObject):
         :type visible: bool
         """
         self.visible_state[key] = visible
-        if key in self.sample_scene:
-            self.sample_scene[key].visible = visible
-        if key in self.instrument_scene:
-            self.instrument_scene[key].visible = visible
+        for scene in (self.sample_scene, self.instrument_scene):
+            node = scene.get(key)
+            if node is not None:
+                node.visible = visible
 
         self.drawActiveScene(False)
 
@@ -270,8 +281,8 @@ class SceneManager(QtCore.QObject):
         :param selections: indicates if node is selected
         :type selections: List[bool]
         """
-        if key in self.sample_scene:
-            node = self.sample_scene[key]
+        node = self.sample_scene.get(key)
+        if node is not None:
             node.selected = selections
 
         self.drawScene(self.sample_scene, False)
@@ -432,8 +443,14 @@ class SceneManager(QtCore.QObject):
                 MeasurementVectorEntity(self.model.measurement_points, self.model.measurement_vectors,
                                         self.rendered_alignment, visible).node())
 
-        if self.model.alignment is not None:
-            self.updateInstrumentScene()
+        alignment = self.model.alignment
+        if alignment is not None:
+            # The instrument model is unchanged by a sample scene edit so only the
+            # changed node is copied into the instrument scene instead of
+            # rebuilding the whole instrument
+            pose = self.model.instrument.positioning_stack.tool_pose
+            self.instrument_scene.addNode(key, self.sample_scene[key].copy(pose @ alignment))
+            self.drawScene(self.instrument_scene, False)
 
         self.drawScene(self.sample_scene)
         if exception is not None:
@@ -1,8 +1,13 @@
 import ctypes
+import hashlib
+import pathlib
 from contextlib import suppress
 import numpy as np
 from OpenGL import GL, error
 from OpenGL.GL import shaders
+from . import _gl_state
+
+PROGRAM_BINARY_CACHE_PATH = pathlib.Path.home() / '.cache' / 'sscanss' / 'shaders'
 
 DEFAULT_VERTEX_SHADER = """
 #version 120
@@ -29,86 +34,57 @@ void main (void)
 GOURAUD_VERTEX_SHADER = """
 #version 120
 
-#define NUM_LIGHTS {0}
 attribute vec4 position;
 attribute vec3 vnormal;
 
 /*******************************************************
 *  Fixed.vert Fixed Function Equivalent Vertex Shader  *
-*        Automatically Generated by GLSL ShaderGen     *
+*        Based on output of GLSL ShaderGen             *
 *          https://github.com/mojocorp/ShaderGen       *
 *******************************************************/
 
 vec4 Ambient;
 vec4 Diffuse;
-vec4 Specular;
 
 void directionalLight(in int i, in vec3 normal)
-{{
-   float nDotVP;         // normal . light direction
-   float nDotHV;         // normal . light half vector
-   float pf;             // power factor
-
-   nDotVP = max(0.0, dot(normal, normalize(vec3 (gl_LightSource[i].position))));
-   nDotHV = max(0.0, dot(normal, vec3 (gl_LightSource[i].halfVector)));
-
-   if (nDotVP == 0.0)
-   {{
-       pf = 0.0;
-   }}
-   else
-   {{
-       pf = pow(nDotHV, gl_FrontMaterial.shininess);
-   }}
+{
+   // normal . light direction
+   float nDotVP = max(0.0, dot(normal, normalize(vec3 (gl_LightSource[i].position))));
 
    Ambient  += gl_LightSource[i].ambient;
    Diffuse  += gl_LightSource[i].diffuse * nDotVP;
-   Specular += gl_LightSource[i].specular * pf;
-}}
+}
 
 
-void flight(in vec3 normal, in vec4 ecPosition, float alphaFade)
-{{
+void flight(in vec3 normal)
+{
     vec4 color;
-    vec3 ecPosition3;
-    vec3 eye;
-
-    ecPosition3 = vec3(ecPosition) / ecPosition.w;
-    eye = vec3 (0.0, 0.0, 1.0);
 
     // Clear the light intensity accumulators
     Ambient  = vec4 (0.0);
     Diffuse  = vec4 (0.0);
-    Specular = vec4 (0.0);
 
-    for (int i=0; i < NUM_LIGHTS; i++)
-        directionalLight(i, normal);
+    // per-light calls unrolled with constant indices by GouraudShader
+__LIGHT_CALLS__
 
     color = gl_FrontLightModelProduct.sceneColor +
             Ambient * gl_Color +
             Diffuse * gl_Color;
 
-    // color += Specular * gl_FrontMaterial.specular;
     color = clamp( color, 0.0, 1.0 );
 
     gl_FrontColor = color;
-    gl_FrontColor.a *= alphaFade;
-}}
+}
 
 
 void main (void)
-{{
-    float alphaFade = 1.0;
-
+{
     // Do fixed functionality vertex transform
-    gl_Position = gl_ModelViewProjectionMatrix * position; 
-
-    // Eye-coordinate position of vertex, needed in various calculations
-    vec4 ecPosition = gl_ModelViewMatrix * position;
+    gl_Position = gl_ModelViewProjectionMatrix * position;
 
     vec3  transformedNormal = normalize(gl_NormalMatrix * vnormal);
-    flight(transformedNormal, ecPosition, alphaFade);
-}}
+    flight(transformedNormal);
+}
 """
 
 GOURAUD_FRAGMENT_SHADER = """
@@ -140,19 +116,23 @@ void main(void) {
 VOLUME_FRAGMENT_SHADER = """
 #version 120
 
+// compile-time flag substituted by VolumeShader so the per-step highlight branch
+// is resolved at compile time instead of diverging per fragment
+#define HIGHLIGHT __HIGHLIGHT__
+
 uniform mat4 inverse_view_proj;
-uniform bool highlight;
-uniform float focal_length;
-uniform float aspect_ratio;
 uniform vec2 viewport_size;
 uniform vec3 top;
 uniform vec3 bottom;
-uniform float step_length;
 
-uniform sampler3D volume;
-uniform sampler1D transfer_func;
+// step length and gamma are configuration constants baked in by VolumeShader so
+// the compiler can fold them instead of fetching uniforms per fragment
+#define step_length __STEP_LENGTH__
+#define gamma __GAMMA__
 
-uniform float gamma;
+uniform sampler3D volume;
+// pre-integrated transfer function: (front intensity, back intensity) -> averaged RGBA
+uniform sampler2D transfer_func;
 
 // Ray
 struct Ray {
@@ -220,12 +200,22 @@ void main(void)
     }
 
     // Ray march until reaching the end of the volume, or colour saturation
+    float prev_intensity = texture3D(volume, position - step_vector).r;
     for (int i = 0; i < num_of_steps; i++)
-    {  
+    {
         float intensity = texture3D(volume, position).r;
-        vec4 c = texture1D(transfer_func, intensity);
-        if (highlight)
-            c = vec4(gl_Color.rgb, c.a) * intensity;
+        vec4 c = texture2D(transfer_func, vec2(prev_intensity, intensity));
+        prev_intensity = intensity;
+#if HIGHLIGHT
+        c = vec4(gl_Color.rgb, c.a) * intensity;
+#endif
+
+        // skip the blending arithmetic through empty space
+        if (c.a < 0.004)
+        {
+            position += step_vector;
+            continue;
+        }
 
         // Alpha-blending
         colour.rgb += (1.0 - colour.a) * c.a * c.rgb;
@@ -287,10 +277,97 @@ class Shader:
     :param fragment_shader: source code for fragment shaders
     :type fragment_shader: str
     """
+    __slots__ = ('id', '_locations', '_shadow')
+    _vector_setters = {(2, ): GL.glUniform2fv, (3, ): GL.glUniform3fv, (4, ): GL.glUniform4fv}
+    _matrix_setters = {(3, 3): GL.glUniformMatrix3fv, (4, 4): GL.glUniformMatrix4fv}
+
     def __init__(self, vertex_shader, fragment_shader):
-        self.id = shaders.compileProgram(shaders.compileShader(vertex_shader, GL.GL_VERTEX_SHADER),
-                                         shaders.compileShader(fragment_shader, GL.GL_FRAGMENT_SHADER),
-                                         validate=False)
+        cache_file = self._binaryCacheFile(vertex_shader, fragment_shader)
+        self.id = self._loadBinary(cache_file)
+        if self.id is None:
+            self.id = shaders.compileProgram(shaders.compileShader(vertex_shader, GL.GL_VERTEX_SHADER),
+                                             shaders.compileShader(fragment_shader, GL.GL_FRAGMENT_SHADER),
+                                             validate=False)
+            self._saveBinary(cache_file)
+        self._locations = {}
+        self._shadow = {}
+
+    @staticmethod
+    def _binaryCacheFile(vertex_shader, fragment_shader):
+        """Returns the program binary cache file for the given sources, or None when
+        the driver does not support program binaries. The key includes the driver
+        identification strings since binaries are not portable across drivers.
+
+        :param vertex_shader: source code for vertex shaders
+        :type vertex_shader: str
+        :param fragment_shader: source code for fragment shaders
+        :type fragment_shader: str
+        :return: cache file path
+        :rtype: Optional[pathlib.Path]
+        """
+        with suppress(error.Error, TypeError):
+            if GL.glGetIntegerv(GL.GL_NUM_PROGRAM_BINARY_FORMATS) > 0:
+                driver = b''.join(
+                    GL.glGetString(name) or b''
+                    for name in (GL.GL_VENDOR, GL.GL_RENDERER, GL.GL_VERSION))
+                key = hashlib.sha1(vertex_shader.encode() + fragment_shader.encode() + driver).hexdigest()
+                return PROGRAM_BINARY_CACHE_PATH / f'{key}.bin'
+        return None
+
+    @staticmethod
+    def _loadBinary(cache_file):
+        """Creates a program from a cached binary, returning None on any failure so
+        the caller falls back to source compilation
+
+        :param cache_file: cache file path
+        :type cache_file: Optional[pathlib.Path]
+        :return: program id
+        :rtype: Optional[int]
+        """
+        if cache_file is None or not cache_file.is_file():
+            return None
+
+        program = None
+        with suppress(error.Error, OSError, ctypes.ArgumentError):
+            data = cache_file.read_bytes()
+            binary_format = int.from_bytes(data[:4], 'little')
+            binary = data[4:]
+            program = GL.glCreateProgram()
+            GL.glProgramBinary(program, binary_format, binary, len(binary))
+            if GL.glGetProgramiv(program, GL.GL_LINK_STATUS) == GL.GL_TRUE:
+                return program
+
+        if program:
+            with suppress(error.Error):
+                GL.glDeleteProgram(program)
+        return None
+
+    def _saveBinary(self, cache_file):
+        """Writes the linked program binary to the cache file; failures are ignored
+        since the cache is only an optimisation
+
+        :param cache_file: cache file path
+        :type cache_file: Optional[pathlib.Path]
+        """
+        if cache_file is None:
+            return
+
+        with suppress(error.Error, OSError, ctypes.ArgumentError):
+            GL.glProgramParameteri(self.id, GL.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL.GL_TRUE)
+            GL.glLinkProgram(self.id)
+            length = GL.glGetProgramiv(self.id, GL.GL_PROGRAM_BINARY_LENGTH)
+            if length <= 0:
+                return
+
+            binary = (ctypes.c_ubyte * length)()
+            written = GL.GLsizei()
+            binary_format = GL.GLenum()
+            GL.glGetProgramBinary(self.id, length, written, binary_format, binary)
+
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix('.tmp')
+            temp_file.write_bytes(binary_format.value.to_bytes(4, 'little') + bytes(binary[:written.value]))
+            temp_file.replace(cache_file)
 
     def destroy(self):
         """Deletes the shader program"""
@@ -299,30 +376,56 @@ class Shader:
     def bind(self):
         """Sets program associated with this object as active program in the
         current OpenGL context"""
-        GL.glUseProgram(self.id)
+        _gl_state.use_program(self.id)
+
+    def uniformLocation(self, name):
+        """Returns the location of the given uniform, caching the driver lookup so
+        repeated setUniform calls avoid a round-trip per frame
+
+        :param name: name of uniform
+        :type name: str
+        :return: location of uniform
+        :rtype: int
+        """
+        location = self._locations.get(name)
+        if location is None:
+            location = GL.glGetUniformLocation(self.id, name)
+            self._locations[name] = location
+
+        return location
 
     def setUniform(self, name, value, transpose=False):
+        # uniforms persist per program so unchanged values need not be re-uploaded;
+        # comparing against a shadow copy is far cheaper than the driver call
+        shadow = self._shadow.get(name)
+        if shadow is not None and np.array_equal(shadow, value):
+            return
+        self._shadow[name] = value if isinstance(value, (int, bool, float)) else np.array(value)
+
         transpose = GL.GL_TRUE if transpose else GL.GL_FALSE
+        location = self.uniformLocation(name)
         if isinstance(value, (int, bool)):
-            GL.glUniform1i(GL.glGetUniformLocation(self.id, name), value)
+            GL.glUniform1i(location, value)
         elif isinstance(value, float):
-            GL.glUniform1f(GL.glGetUniformLocation(self.id, name), value)
-        elif np.shape(value) == (2, ):
-            GL.glUniform2fv(GL.glGetUniformLocation(self.id, name), 1, value)
-        elif np.shape(value) == (3, ):
-            GL.glUniform3fv(GL.glGetUniformLocation(self.id, name), 1, value)
-        elif np.shape(value) == (3, 3):
-            GL.glUniformMatrix3fv(GL.glGetUniformLocation(self.id, name), 1, transpose, value)
-        elif np.shape(value) == (4, 4):
-            GL.glUniformMatrix4fv(GL.glGetUniformLocation(self.id, name), 1, transpose, value)
+            GL.glUniform1f(location, value)
+        else:
+            setter = self._vector_setters.get(np.shape(value))
+            if setter is not None:
+                setter(location, 1, value)
+            else:
+                setter = self._matrix_setters.get(np.shape(value))
+                if setter is not None:
+                    setter(location, 1, transpose, value)
 
     def release(self):
         """Releases the active shader program in the current OpenGL context"""
-        GL.glUseProgram(0)
+        _gl_state.use_program(0)
 
 
 class DefaultShader(Shader):
     """Creates a GLSL program the renders primitives with colour"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(DEFAULT_VERTEX_SHADER, DEFAULT_FRAGMENT_SHADER)
 
@@ -333,20 +436,37 @@ class GouraudShader(Shader):
     :param number_of_lights: number of lights in the scene
     :type number_of_lights: int
     """
+    __slots__ = ()
+
     def __init__(self, number_of_lights):
-        vertex_shader = GOURAUD_VERTEX_SHADER.format(number_of_lights)
+        calls = '\n'.join(f'    directionalLight({index}, normal);' for index in range(number_of_lights))
+        vertex_shader = GOURAUD_VERTEX_SHADER.replace('__LIGHT_CALLS__', calls)
 
         super().__init__(vertex_shader, GOURAUD_FRAGMENT_SHADER)
 
 
 class VolumeShader(Shader):
-    """Creates a GLSL program the renders a volume"""
-    def __init__(self):
-        super().__init__(VOLUME_VERTEX_SHADER, VOLUME_FRAGMENT_SHADER)
+    """Creates a GLSL program the renders a volume
+
+    :param highlight: indicates the volume should be highlighted
+    :type highlight: bool
+    :param step_length: distance between samples along the ray
+    :type step_length: float
+    :param gamma: gamma correction exponent
+    :type gamma: float
+    """
+    __slots__ = ()
+
+    def __init__(self, highlight=False, step_length=0.001, gamma=2.2):
+        fragment_shader = (VOLUME_FRAGMENT_SHADER.replace('__HIGHLIGHT__', '1' if highlight else '0').replace(
+            '__STEP_LENGTH__', f'{step_length}').replace('__GAMMA__', f'{gamma}'))
+        super().__init__(VOLUME_VERTEX_SHADER, fragment_shader)
 
 
 class TextShader(Shader):
     """Creates a GLSL program the renders a volume"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(TEXT_VERTEX_SHADER, TEXT_FRAGMENT_SHADER)
 
@@ -360,13 +480,29 @@ class VertexArray:
     :type indices: numpy.ndarray
     :param normals: N x 3 array of normal
     :type normals: numpy.ndarray
+    :param uvs: N x 2 array of texture coordinates
+    :type uvs: numpy.ndarray
     """
+    __slots__ = ('count', 'buffers', 'normal_buffer', 'interleaved', 'vao', 'vertex_buffer', 'element_buffer',
+                 'index_type', 'index_size')
+
     def __init__(self, vertices, indices, normals=None, uvs=None):
 
         self.count = len(indices)
         self.buffers = []
         self.normal_buffer = None
-        self.uv_buffer = None
+
+        # texture coordinates are interleaved with positions into a single
+        # [x, y, z, u, v] buffer so one bind serves both attributes and the whole
+        # vertex is fetched from one contiguous stretch of memory
+        self.interleaved = uvs is not None and len(uvs) > 0
+        if self.interleaved:
+            vertices = np.ascontiguousarray(np.hstack((vertices, uvs)), np.float32)
+
+        # a vertex array object records the attribute setup so bind() reduces to a
+        # single call, but construction can happen while no context is current so the
+        # recording is deferred to the first bind
+        self.vao = None
 
         self.vertex_buffer = GL.glGenBuffers(1)
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vertex_buffer)
@@ -379,11 +515,12 @@ class VertexArray:
             GL.glBufferData(GL.GL_ARRAY_BUFFER, normals.nbytes, normals, GL.GL_STATIC_DRAW)
             self.buffers.append(self.normal_buffer)
 
-        if uvs is not None and len(uvs) > 0:
-            self.uv_buffer = GL.glGenBuffers(1)
-            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.uv_buffer)
-            GL.glBufferData(GL.GL_ARRAY_BUFFER, uvs.nbytes, uvs, GL.GL_STATIC_DRAW)
-            self.buffers.append(self.uv_buffer)
+        # 16-bit indices halve the index-buffer bandwidth and footprint when the
+        # vertex count permits; draw calls read the type and size back from here
+        if indices.size > 0 and indices.max() < 65536:
+            indices = indices.astype(np.uint16, copy=False)
+        self.index_type = GL.GL_UNSIGNED_SHORT if indices.itemsize == 2 else GL.GL_UNSIGNED_INT
+        self.index_size = indices.itemsize
 
         self.element_buffer = GL.glGenBuffers(1)
         GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, self.element_buffer)
@@ -395,28 +532,54 @@ class VertexArray:
 
     def __del__(self):
         with suppress(error.Error, ctypes.ArgumentError):
+            if self.vao:
+                GL.glDeleteVertexArrays(1, [self.vao])
             GL.glDeleteBuffers(len(self.buffers), self.buffers)
 
-    def bind(self):
-        """Binds the buffers associated with this object to the current OpenGL context"""
+    def _setAttributePointers(self):
+        """Enables the vertex attributes and binds their buffers in the current OpenGL context"""
         GL.glEnableVertexAttribArray(0)
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vertex_buffer)
-        GL.glVertexAttribPointer(0, 3, GL.GL_FLOAT, GL.GL_FALSE, 12, ctypes.c_void_p(0))
+        if self.interleaved:
+            GL.glVertexAttribPointer(0, 3, GL.GL_FLOAT, GL.GL_FALSE, 20, ctypes.c_void_p(0))
+            GL.glEnableVertexAttribArray(1)
+            GL.glVertexAttribPointer(1, 2, GL.GL_FLOAT, GL.GL_FALSE, 20, ctypes.c_void_p(12))
+        else:
+            GL.glVertexAttribPointer(0, 3, GL.GL_FLOAT, GL.GL_FALSE, 12, ctypes.c_void_p(0))
 
         if self.normal_buffer is not None:
             GL.glEnableVertexAttribArray(self.buffers.index(self.normal_buffer))
             GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.normal_buffer)
             GL.glVertexAttribPointer(1, 3, GL.GL_FLOAT, GL.GL_FALSE, 12, ctypes.c_void_p(0))
 
-        if self.uv_buffer is not None:
-            GL.glEnableVertexAttribArray(self.buffers.index(self.uv_buffer))
-            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.uv_buffer)
-            GL.glVertexAttribPointer(1, 2, GL.GL_FLOAT, GL.GL_FALSE, 8, ctypes.c_void_p(0))
-
         GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, self.element_buffer)
 
+    def bind(self):
+        """Binds the buffers associated with this object to the current OpenGL context. The
+        attribute setup is recorded into a vertex array object on the first call, when the
+        renderer has made the context current; contexts without VAO support fall back to
+        re-specifying the attribute pointers on every bind"""
+        if self.vao is None:
+            self.vao = 0
+            with suppress(error.Error):
+                vao = GL.glGenVertexArrays(1)
+                GL.glBindVertexArray(vao)
+                self._setAttributePointers()
+                self.vao = vao
+                return
+
+        if self.vao:
+            GL.glBindVertexArray(self.vao)
+            return
+
+        self._setAttributePointers()
+
     def release(self):
         """Releases the buffers associated with this object from the current OpenGL context"""
+        if self.vao:
+            GL.glBindVertexArray(0)
+            return
+
         GL.glDisableVertexAttribArray(0)
         GL.glDisableVertexAttribArray(1)
         GL.glDisableVertexAttribArray(2)
@@ -430,17 +593,28 @@ class Texture3D:
     :param data:  3D array of volume
     :type data: numpy.ndarray
     """
+    __slots__ = ('unit', 'pbo', 'texture')
+
     def __init__(self, data):
+        self.unit = GL.GL_TEXTURE0
         width, height, depth = data.shape
 
+        # the texture expects the width (first) axis fastest, i.e. Fortran layout; volume
+        # render targets are already Fortran ordered so this is normally a no-op view
+        # rather than a CPU-side copy of the whole volume
+        data = np.asfortranarray(data)
+
         try:
             self.pbo = GL.glGenBuffers(1)
             self.texture = GL.glGenTextures(1)
-            # map and modify pixel buffer
+            # map and modify pixel buffer. STREAM_DRAW tells the driver the contents are
+            # written once then consumed, and the write-only invalidating range map avoids
+            # the GPU synchronisation stall glMapBuffer(GL_WRITE_ONLY) can incur
             GL.glBindBuffer(GL.GL_PIXEL_UNPACK_BUFFER, self.pbo)
-            GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, data.nbytes, None, GL.GL_STATIC_DRAW)
-            mapped_buffer = GL.glMapBuffer(GL.GL_PIXEL_UNPACK_BUFFER, GL.GL_WRITE_ONLY)
-            ctypes.memmove(mapped_buffer, data.transpose().ctypes.data, data.nbytes)
+            GL.glBufferData(GL.GL_PIXEL_UNPACK_BUFFER, data.nbytes, None, GL.GL_STREAM_DRAW)
+            mapped_buffer = GL.glMapBufferRange(GL.GL_PIXEL_UNPACK_BUFFER, 0, data.nbytes,
+                                                GL.GL_MAP_WRITE_BIT | GL.GL_MAP_INVALIDATE_BUFFER_BIT)
+            ctypes.memmove(mapped_buffer, data.ctypes.data, data.nbytes)
             GL.glUnmapBuffer(GL.GL_PIXEL_UNPACK_BUFFER)
 
             self.texture = GL.glGenTextures(1)
@@ -472,12 +646,12 @@ class Texture3D:
         :param texture: texture unit
         :type texture: GL.Constant
         """
-        GL.glActiveTexture(texture)
-        GL.glBindTexture(GL.GL_TEXTURE_3D, self.texture)
+        self.unit = texture
+        _gl_state.bind_texture(texture, GL.GL_TEXTURE_3D, self.texture)
 
     def release(self):
         """Releases the buffers associated with this object from the current OpenGL context"""
-        GL.glBindTexture(GL.GL_TEXTURE_3D, GL.GL_FALSE)
+        _gl_state.bind_texture(self.unit, GL.GL_TEXTURE_3D, 0)
 
 
 class Texture1D:
@@ -486,8 +660,11 @@ class Texture1D:
     :param data: 1D array of RGBA values
     :type data: numpy.ndarray
     """
+    __slots__ = ('unit', 'texture')
+
     def __init__(self, data):
 
+        self.unit = GL.GL_TEXTURE0
         self.texture = GL.glGenTextures(1)
 
         GL.glBindTexture(GL.GL_TEXTURE_1D, self.texture)
@@ -495,7 +672,8 @@ class Texture1D:
         GL.glTexParameteri(GL.GL_TEXTURE_1D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_LINEAR)
         GL.glTexParameteri(GL.GL_TEXTURE_1D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
         GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
-        GL.glTexImage1D(GL.GL_TEXTURE_1D, 0, GL.GL_RGBA, data.size // 4, 0, GL.GL_RGBA, GL.GL_FLOAT, data)
+        pixel_type = GL.GL_UNSIGNED_BYTE if data.dtype == np.uint8 else GL.GL_FLOAT
+        GL.glTexImage1D(GL.GL_TEXTURE_1D, 0, GL.GL_RGBA, data.size // 4, 0, GL.GL_RGBA, pixel_type, data)
         GL.glBindTexture(GL.GL_TEXTURE_1D, GL.GL_FALSE)
 
     def __del__(self):
@@ -508,12 +686,12 @@ class Texture1D:
         :param texture: texture unit
         :type texture: GL.Constant
         """
-        GL.glActiveTexture(texture)
-        GL.glBindTexture(GL.GL_TEXTURE_1D, self.texture)
+        self.unit = texture
+        _gl_state.bind_texture(texture, GL.GL_TEXTURE_1D, self.texture)
 
     def release(self):
         """Releases the texture from the current OpenGL context"""
-        GL.glBindTexture(GL.GL_TEXTURE_1D, GL.GL_FALSE)
+        _gl_state.bind_texture(self.unit, GL.GL_TEXTURE_1D, 0)
 
 
 class Texture2D:
@@ -522,8 +700,11 @@ class Texture2D:
     :param data: 2D array of RGBA values
     :type data: numpy.ndarray
     """
+    __slots__ = ('unit', 'texture')
+
     def __init__(self, data):
 
+        self.unit = GL.GL_TEXTURE0
         self.texture = GL.glGenTextures(1)
         GL.glBindTexture(GL.GL_TEXTURE_2D, self.texture)
 
@@ -531,12 +712,20 @@ class Texture2D:
         GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_S, GL.GL_CLAMP_TO_EDGE)
         GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_T, GL.GL_CLAMP_TO_EDGE)
 
+        # float data (e.g. the pre-integrated transfer function) is stored at full
+        # precision and sampled with linear filtering, text glyphs stay 8-bit nearest
+        if data.dtype == np.float32:
+            internal_format, pixel_type, interpolation = GL.GL_RGBA32F, GL.GL_FLOAT, GL.GL_LINEAR
+        else:
+            internal_format, pixel_type, interpolation = GL.GL_RGBA, GL.GL_UNSIGNED_BYTE, GL.GL_NEAREST
+
         # Set texture filtering parameters
-        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_NEAREST)
-        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_NEAREST)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, interpolation)
+        GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, interpolation)
 
-        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGBA, data.shape[1], data.shape[0], 0, GL.GL_RGBA,
-                        GL.GL_UNSIGNED_BYTE, data)
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 1)
+        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, internal_format, data.shape[1], data.shape[0], 0, GL.GL_RGBA, pixel_type,
+                        data)
 
     def __del__(self):
         with suppress(error.Error, ctypes.ArgumentError):
@@ -548,12 +737,12 @@ class Texture2D:
         :param texture: texture unit
         :type texture: GL.Constant
         """
-        GL.glActiveTexture(GL.GL_TEXTURE0)
-        GL.glBindTexture(GL.GL_TEXTURE_2D, self.texture)
+        self.unit = texture
+        _gl_state.bind_texture(texture, GL.GL_TEXTURE_2D, self.texture)
 
     def release(self):
         """Releases the texture from the current OpenGL context"""
-        GL.glBindTexture(GL.GL_TEXTURE_1D, GL.GL_FALSE)
+        _gl_state.bind_texture(self.unit, GL.GL_TEXTURE_2D, 0)
 
 
 class Text3D:
@@ -564,6 +753,8 @@ class Text3D:
     :param image_data: 2d image containing text
     :type image_data: numpy.ndarray
     """
+    __slots__ = ('texture', 'vertex_array', 'count')
+
     def __init__(self, size, image_data):
         self.texture = Texture2D(image_data)
 
@@ -571,7 +762,9 @@ class Text3D:
         vertices = np.array([[-half_width, -half_height, 0], [-half_width, half_height, 0.],
                              [half_width, -half_height, 0.], [half_width, half_height, 0.]], np.float32)
         uvs = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], np.float32)
-        indices = np.array([0, 1, 2, 1, 2, 3], np.uint32)
+        # the second triangle leads with the vertices shared with the first so both
+        # are still warm in the GPU post-transform cache
+        indices = np.array([0, 1, 2, 2, 1, 3], np.uint32)
 
         self.vertex_array = VertexArray(vertices, indices, uvs=uvs)
         self.count = self.vertex_array.count
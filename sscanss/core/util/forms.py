@@ -20,7 +20,8 @@ class RequiredValidator(Validator):
     """
     def __init__(self, control):
         self.control = control
-        self.error = '{} is required.'
+        # The title is fixed at construction so the message is formatted once
+        self.error = f'{control.title} is required.'
 
     def valid(self):
         """Validates control's input
@@ -29,7 +30,7 @@ class RequiredValidator(Validator):
         :rtype: bool
         """
         if not self.control.text.strip():
-            self.control.isInvalid(self.error.format(self.control.title))
+            self.control.isInvalid(self.error)
             return False
         return True
 
@@ -56,11 +57,18 @@ class RangeValidator(Validator):
         self.max_exclusive = max_exclusive
         self.min_exclusive = min_exclusive
 
-        self.number_error = '{} should be a number.'
-        self.min_error = '{} should be higher or equal to {}.'
-        self.min_exc_error = '{} should be higher than {}.'
-        self.max_error = '{} should be lower or equal to {}.'
-        self.max_exc_error = '{} should be lower than {}.'
+        # The title and bounds are fixed at construction so the messages are
+        # formatted once instead of on every invalid keystroke
+        title = control.title
+        self.number_error = f'{title} should be a number.'
+        if min_exclusive:
+            self.min_error = f'{title} should be higher than {minimum}.'
+        else:
+            self.min_error = f'{title} should be higher or equal to {minimum}.'
+        if max_exclusive:
+            self.max_error = f'{title} should be lower than {maximum}.'
+        else:
+            self.max_error = f'{title} should be lower or equal to {maximum}.'
 
     def valid(self):
         """Validates control's input
@@ -75,36 +83,28 @@ class RangeValidator(Validator):
         if not self.control.required and not text:
             return True
 
-        title = self.control.title
-
-        value = to_float(text)
+        value = self.control.toFloat()
         if value is None:
-            self.control.isInvalid(self.number_error.format(title))
+            self.control.isInvalid(self.number_error)
             return False
 
         max_logic = None
-        max_error = ''
         if self.maximum is not None and self.max_exclusive:
             max_logic = value >= self.maximum
-            max_error = self.max_exc_error
         elif self.maximum is not None and not self.max_exclusive:
             max_logic = value > self.maximum
-            max_error = self.max_error
 
         if max_logic:
-            self.control.isInvalid(max_error.format(title, self.maximum))
+            self.control.isInvalid(self.max_error)
             return False
 
         min_logic = None
-        min_error = ''
         if self.minimum is not None and self.min_exclusive:
             min_logic = value <= self.minimum
-            min_error = self.min_exc_error
         elif self.minimum is not None and not self.min_exclusive:
             min_logic = value < self.minimum
-            min_error = self.min_error
         if min_logic:
-            self.control.isInvalid(min_error.format(title, self.minimum))
+            self.control.isInvalid(self.min_error)
             return False
 
         return True
@@ -139,7 +139,8 @@ class CompareValidator(Validator):
         self.control = control
         self.compare_op = operation
         self.compare_with = compare_with
-        self.control.form_lineedit.textChanged.connect(lambda ignore: compare_with.validate())
+        # PyQt discards the surplus text argument when a plain method is connected
+        self.control.form_lineedit.textChanged.connect(compare_with.validate)
         if self.compare_op == CompareValidator.Operator.Equal:
             self.compare_error = self.compare_equality_error
         elif self.compare_op == CompareValidator.Operator.Not_Equal:
@@ -151,21 +152,24 @@ class CompareValidator(Validator):
         else:
             raise ValueError(f'Invalid Compare Operator with type: {type(operation)}')
 
+        # Both titles are fixed at construction so the message is formatted once
+        self.compare_error = self.compare_error.format(control.title, compare_with.title)
+
     def valid(self):
         """Validates control's input
 
         :return: indicates input are valid
         :rtype: bool
         """
-        error = self.compare_error.format(self.control.title, self.compare_with.title)
+        error = self.compare_error
         value = self.control.text.strip()
         value_2 = self.compare_with.text.strip()
         if not self.control.required and not value and not value_2:
             return True
 
         if self.control.number:
-            value = to_float(value)
-            value_2 = to_float(value_2)
+            value = self.control.toFloat()
+            value_2 = self.compare_with.toFloat()
             if value is None or value_2 is None:
                 self.control.isInvalid(error)
                 return False
@@ -241,6 +245,8 @@ class FormGroup(QtWidgets.QWidget):
 
         self.top_level = []
         self.form_controls = []
+        self.control_states = {}
+        self.invalid_count = 0
         self.valid = True
         if layout == FormGroup.Layout.Vertical:
             self.main_layout = QtWidgets.QVBoxLayout()
@@ -275,26 +281,65 @@ class FormGroup(QtWidgets.QWidget):
             for widget in extra_widgets:
                 self.main_layout.addWidget(widget)
 
-        control.input_validation.connect(self.validateGroup)
+        control.input_validation.connect(lambda state, c=control: self.updateGroupState(c, state))
+        self.control_states[control] = control.valid
+        self.invalid_count += not control.valid
         self.valid &= control.valid
 
+    def updateGroupState(self, control, state):
+        """Updates the validation state of the group from a single control's new state
+        without scanning the whole group
+
+        :param control: control whose state changed
+        :type control: FormControl
+        :param state: validation state of the control
+        :type state: bool
+        """
+        if state != self.control_states[control]:
+            self.control_states[control] = state
+            self.invalid_count += -1 if state else 1
+
+        self.valid = self.invalid_count == 0
+        self.group_validation.emit(self.valid)
+
     def validateGroup(self):
         """Checks if all controls in the group are valid if so returns True
 
         :return: group validation state
         :rtype: bool
         """
+        self.invalid_count = 0
         for control in self.form_controls:
-            if not control.valid:
-                self.valid = False
-                break
-        else:
-            self.valid = True
+            self.control_states[control] = control.valid
+            self.invalid_count += not control.valid
 
+        self.valid = self.invalid_count == 0
         self.group_validation.emit(self.valid)
         return self.valid
 
 
+_double_validators = {}
+
+
+def _doubleValidator(decimals):
+    """Returns a double validator for the given decimal count. Validators are
+    stateless so a single instance per decimal count is shared by every control
+
+    :param decimals: number of decimal place allowed
+    :type decimals: int
+    :return: shared double validator
+    :rtype: QtGui.QDoubleValidator
+    """
+    validator = _double_validators.get(decimals)
+    if validator is None:
+        validator = QtGui.QDoubleValidator()
+        validator.setDecimals(decimals)
+        validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
+        _double_validators[decimals] = validator
+
+    return validator
+
+
 class FormControl(QtWidgets.QWidget):
     """Creates a widget that provides form input with validation
 
@@ -346,13 +391,15 @@ class FormControl(QtWidgets.QWidget):
 
         if number:
             self.range_validator = RangeValidator(self, None, None)
-            self._validator = QtGui.QDoubleValidator()
-            self._validator.setDecimals(decimals)
-            self._validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
+            self._validator = _doubleValidator(decimals)
             self.form_lineedit.setValidator(self._validator)
             self.form_lineedit.setMaxLength(12)
 
         self.valid = False
+        self.error_shown = False
+        self._parsed_text = None
+        self._parsed_value = None
+        self._last_validated = None
 
         self.value = value
         self.form_lineedit.textChanged.connect(self.validate)
@@ -391,6 +438,7 @@ class FormControl(QtWidgets.QWidget):
         self.range_validator = RangeValidator(self, self._fixup(minimum), self._fixup(maximum), min_exclusive,
                                               max_exclusive)
 
+        self._last_validated = None
         self.validate()
 
     def _fixup(self, value):
@@ -399,6 +447,20 @@ class FormControl(QtWidgets.QWidget):
 
         return round(value, self._validator.decimals())
 
+    def toFloat(self):
+        """Parses the control's text as a float, memoized on the text so the
+        validators and the value getter share a single parse per edit
+
+        :return: parsed value or None if conversion failed
+        :rtype: Optional[float]
+        """
+        text = self.form_lineedit.text()
+        if text != self._parsed_text:
+            self._parsed_text = text
+            self._parsed_value = to_float(text)
+
+        return self._parsed_value
+
     @property
     def value(self):
         """value return a float if the control is a number otherwise return a string.
@@ -407,11 +469,10 @@ class FormControl(QtWidgets.QWidget):
         :return: value in the form control
         :rtype: Union[str, float]
         """
-        text = self.form_lineedit.text()
         if not self.number:
-            return text
+            return self.form_lineedit.text()
 
-        value = to_float(text)
+        value = self.toFloat()
         if value is None:
             raise ValueError('FormControl value is not a number')
 
@@ -444,12 +505,24 @@ class FormControl(QtWidgets.QWidget):
         :type operation: CompareValidator.Operator
         """
         self.compare_validator = CompareValidator(self, form_control, operation)
+        self._last_validated = None
         self.validate()
 
     def validate(self):
         """Performs validation for the value in the control. The validation performed (required,
-        compare, range, or number) is dependent on which flags have been set.
+        compare, range, or number) is dependent on which flags have been set. The validated
+        text (and the peer's text for comparisons) is remembered so repeat calls with
+        unchanged inputs e.g. from the peer in a mutual comparison, return early.
         """
+        if self.compare_validator is not None:
+            state = (self.text, self.compare_validator.compare_with.text)
+        else:
+            state = (self.text, None)
+
+        if state == self._last_validated:
+            return
+        self._last_validated = state
+
         if self.required and not self.required_validator.valid():
             return
 
@@ -463,8 +536,10 @@ class FormControl(QtWidgets.QWidget):
 
     def isValid(self):
         """Puts the control to an valid state """
-        self.form_lineedit.setStyleSheet('')
-        self.validation_label.setText('')
+        if self.error_shown:
+            self.form_lineedit.setStyleSheet('')
+            self.validation_label.setText('')
+            self.error_shown = False
         self.valid = True
         self.input_validation.emit(True)
 
@@ -474,7 +549,9 @@ class FormControl(QtWidgets.QWidget):
         :param error: error message
         :type error: str
         """
-        self.form_lineedit.setStyleSheet('border: 1px solid red;')
+        if not self.error_shown:
+            self.form_lineedit.setStyleSheet('border: 1px solid red;')
+            self.error_shown = True
         self.validation_label.setText(error)
         self.valid = False
         self.input_validation.emit(False)
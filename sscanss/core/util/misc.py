@@ -150,7 +150,9 @@ class PlaneOptions(Enum):
 
 
 def to_float(string):
-    """Converts a string to a float if possible otherwise returns None
+    """Converts a string to a float if possible otherwise returns None. This is
+    intended for single values (e.g. widget text); bulk conversion should go
+    through numpy e.g. np.array(rows, np.float32) as the file readers do
 
     :param string: a string to convert to a float
     :type string: str
@@ -1,5 +1,6 @@
-import contextlib
+import copy
 from enum import Enum, unique
+from functools import cached_property
 from PyQt5 import QtCore, QtGui, QtWidgets
 from sscanss.core.util import ColourPicker, FilePicker, to_float, FormTitle
 
@@ -30,6 +31,9 @@ class Designer(QtWidgets.QWidget):
         self.add_update_button = QtWidgets.QPushButton('Update Entry')
         self.add_update_button.clicked.connect(self.updateJson)
         self.component = None
+        self.component_cache = {}
+        self._last_component = None
+        self._last_json = None
 
         self.title = FormTitle('')
         self.title.addHeaderControl(self.add_update_button)
@@ -41,11 +45,14 @@ class Designer(QtWidgets.QWidget):
     def clear(self):
         self.json = {}
         self.folder_path = '.'
-        if self.component is not None:
-            self.component.reset()
+        self._last_component = None
+        self._last_json = None
+        for component in self.component_cache.values():
+            component.reset()
 
     def setComponent(self, component_type):
-        """Sets the current component to one of the specified type
+        """Sets the current component to one of the specified type. Components are
+        created on first use and cached so switching types does not rebuild widgets
 
         :param component_type: component type
         :type component_type: Designer.Component
@@ -54,28 +61,40 @@ class Designer(QtWidgets.QWidget):
             if self.component.type == component_type:
                 return
 
-            self.layout.removeWidget(self.component)
-            self.component.hide()
-            self.component.deleteLater()
-
-        self.title.label.setText(component_type.value)
-        if component_type == Designer.Component.Jaws:
-            self.component = JawComponent()
-        elif component_type == Designer.Component.General:
-            self.component = GeneralComponent()
-        elif component_type == Designer.Component.Detector:
-            self.component = DetectorComponent()
-        elif component_type == Designer.Component.Collimator:
-            self.component = CollimatorComponent()
-        elif component_type == Designer.Component.FixedHardware:
-            self.component = FixedHardwareComponent()
-        elif component_type == Designer.Component.PositioningStacks:
-            self.component = PositioningStacksComponent()
-
-        self.layout.insertWidget(1, self.component)
+        # Suspend painting so removing the old component and inserting the
+        # new one repaints once
+        self.setUpdatesEnabled(False)
+        try:
+            if self.component is not None:
+                self.layout.removeWidget(self.component)
+                self.component.hide()
+
+            self.title.label.setText(component_type.value)
+            component = self.component_cache.get(component_type)
+            if component is None:
+                if component_type == Designer.Component.Jaws:
+                    component = JawComponent()
+                elif component_type == Designer.Component.General:
+                    component = GeneralComponent()
+                elif component_type == Designer.Component.Detector:
+                    component = DetectorComponent()
+                elif component_type == Designer.Component.Collimator:
+                    component = CollimatorComponent()
+                elif component_type == Designer.Component.FixedHardware:
+                    component = FixedHardwareComponent()
+                elif component_type == Designer.Component.PositioningStacks:
+                    component = PositioningStacksComponent()
+                self.component_cache[component_type] = component
+
+            self.component = component
+            self.layout.insertWidget(1, self.component)
+            self.component.show()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def setJson(self, json_data):
-        """Sets the json data of the designer
+        """Sets the json data of the designer. Widgets are only repopulated when the
+        json differs from what the shown component was last populated with
 
         :param json_data: instrument json
         :type json_data: Dict[str, Any]
@@ -84,7 +103,12 @@ class Designer(QtWidgets.QWidget):
             return
 
         self.json = json_data
+        if self.component is self._last_component and json_data == self._last_json:
+            return
+
         self.component.updateValue(self.json, self.folder_path)
+        self._last_component = self.component
+        self._last_json = copy.deepcopy(json_data)
 
     def updateJson(self):
         """Updates the json from the current component"""
@@ -224,7 +248,8 @@ class VisualSubComponent(QtWidgets.QWidget):
 
         colour = self.colour_picker.value
         if colour.name() != '#000000':
-            json_data['colour'] = [round(colour.redF(), 2), round(colour.greenF(), 2), round(colour.blueF(), 2)]
+            red, green, blue, _ = colour.getRgbF()
+            json_data['colour'] = [round(red, 2), round(green, 2), round(blue, 2)]
 
         mesh = self.file_picker.value
         if mesh:
@@ -233,8 +258,12 @@ class VisualSubComponent(QtWidgets.QWidget):
         return {self.key: json_data}
 
 
+_double_validators = {}
+
+
 def create_validated_line_edit(decimal=3, text=''):
-    """Creates a line edit with a number validator
+    """Creates a line edit with a number validator. Validators are stateless so a
+    single instance per decimal count is shared by every line edit
 
     :param decimal: number of decimal place allowed
     :type decimal: int
@@ -243,10 +272,14 @@ def create_validated_line_edit(decimal=3, text=''):
     :return: line edit with validator
     :rtype: QtWidgets.QLineEdit
     """
+    validator = _double_validators.get(decimal)
+    if validator is None:
+        validator = QtGui.QDoubleValidator()
+        validator.setDecimals(decimal)
+        validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
+        _double_validators[decimal] = validator
+
     line_edit = QtWidgets.QLineEdit()
-    validator = QtGui.QDoubleValidator()
-    validator.setDecimals(decimal)
-    validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
     line_edit.setValidator(validator)
     line_edit.setText(text)
 
@@ -400,7 +433,7 @@ class JawComponent(QtWidgets.QWidget):
         self.visuals = VisualSubComponent()
         layout.addWidget(self.visuals, 6, 0, 1, 3)
 
-    @property
+    @cached_property
     def __required_widgets(self):
         """Generates dict of required widget for validation. The key is the validation
         label and the value is a list of widget in the same row as the validation label
@@ -589,7 +622,7 @@ class GeneralComponent(QtWidgets.QWidget):
         layout.addWidget(QtWidgets.QLabel('Script Template: '), 3, 0)
         layout.addWidget(self.script_picker, 3, 1)
 
-    @property
+    @cached_property
     def __required_widgets(self):
         """Generates dict of required widget for validation. The key is the validation
         label and the value is a list of widget in the same row as the validation label
@@ -753,7 +786,7 @@ class DetectorComponent(QtWidgets.QWidget):
         layout.addWidget(QtWidgets.QLabel('Positioner: '), 3, 0)
         layout.addWidget(self.positioner_combobox, 3, 1)
 
-    @property
+    @cached_property
     def __required_widgets(self):
         """Generates dict of required widget for validation. The key is the validation
         label and the value is a list of widgets in the same row as the validation label
@@ -766,7 +799,7 @@ class DetectorComponent(QtWidgets.QWidget):
             [self.x_diffracted_beam, self.y_diffracted_beam, self.z_diffracted_beam]
         }
 
-    @property
+    @cached_property
     def __required_comboboxes(self):
         """Generates dict of required comboboxes for validation. The key is the validation
         label and the value is a list of widgets in the same row as the validation label
@@ -868,11 +901,7 @@ class DetectorComponent(QtWidgets.QWidget):
         if name is not None:
             self.detector_name_combobox.setCurrentText(name)
 
-        detectors = []
-        for data in self.detector_list:
-            name = data.get('name', '')
-            if name:
-                detectors.append(name)
+        detectors = [data.get('name', '') for data in self.detector_list if data.get('name', '')]
 
         # Rewrite the combobox to contain the new list of detectors, and reset the index to the current value
         index = max(self.detector_name_combobox.currentIndex(), 0)
@@ -886,13 +915,14 @@ class DetectorComponent(QtWidgets.QWidget):
         # NOTE -- if the detector name is changed in the JSON directly, the list of collimators for the detector will
         #         NOT be updated. However, if "value()" is called immediately prior to this routine (via the
         #         "Update Entry" button in the editor) then the collimators for this detector WILL have been updated.
-        collimators = []
+        collimators_by_detector = {}
         collimators_data = instrument_data.get('collimators', [])
         for data in collimators_data:
             collimator_name = data.get('name', '')
             detector = data.get('detector', '')
-            if collimator_name and detector == self.detector_name_combobox.currentText():
-                collimators.append(collimator_name)
+            if collimator_name and detector:
+                collimators_by_detector.setdefault(detector, []).append(collimator_name)
+        collimators = collimators_by_detector.get(self.detector_name_combobox.currentText(), [])
         self.default_collimator_combobox.clear()
         self.default_collimator_combobox.addItems(['None', *collimators])
         default_collimator = detector_data.get('default_collimator', 'None')
@@ -909,12 +939,8 @@ class DetectorComponent(QtWidgets.QWidget):
             self.z_diffracted_beam.setText(f"{safe_get_value(diffracted_beam, 2, '')}")
 
         # Positioners combobox
-        positioners = []
         positioners_data = instrument_data.get('positioners', [])
-        for data in positioners_data:
-            positioner_name = data.get('name', '')
-            if positioner_name:
-                positioners.append(positioner_name)
+        positioners = [data.get('name', '') for data in positioners_data if data.get('name', '')]
         self.positioner_combobox.clear()
         self.positioner_combobox.addItems(['None', *positioners])
         positioner = detector_data.get('positioner', 'None')
@@ -1011,7 +1037,7 @@ class CollimatorComponent(QtWidgets.QWidget):
 
         # The "activated" signal is emitted when the user re-selects the same option,
         # so we can ensure the "Add New..." text is cleared each time it is selected.
-        self.detector_combobox.activated.connect(lambda: self.setNewDetector())
+        self.detector_combobox.activated.connect(self.setNewDetector)
 
         # Aperture field - array of floats, required
         self.x_aperture = create_validated_line_edit(3)
@@ -1028,7 +1054,7 @@ class CollimatorComponent(QtWidgets.QWidget):
         self.visuals = VisualSubComponent()
         layout.addWidget(self.visuals, 4, 0, 1, 3)
 
-    @property
+    @cached_property
     def __required_widgets(self):
         """Generates dict of required widget for validation. The key is the validation
         label and the value is a list of widgets in the same row as the validation label
@@ -1041,7 +1067,7 @@ class CollimatorComponent(QtWidgets.QWidget):
             self.aperture_validation_label: [self.x_aperture, self.y_aperture]
         }
 
-    @property
+    @cached_property
     def __required_comboboxes(self):
         """Generates dict of required comboboxes for validation. The key is the validation
         label and the value is a list of widgets in the same row as the validation label
@@ -1148,11 +1174,9 @@ class CollimatorComponent(QtWidgets.QWidget):
             collimator_data = {}
 
         # Collimators combobox
-        collimators = []
-        for index, data in enumerate(self.collimator_list):
-            name = data.get('name', '')
-            if name:
-                collimators.append(f"Collimator {index + 1}")
+        collimators = [
+            f"Collimator {index + 1}" for index, data in enumerate(self.collimator_list) if data.get('name', '')
+        ]
 
         # Rewrite the combobox to contain the new list of collimators, and reset the index to the current value
         index = max(self.collimator_combobox.currentIndex(), 0)
@@ -1168,12 +1192,8 @@ class CollimatorComponent(QtWidgets.QWidget):
             self.collimator_name.setText(name)
 
         # Detectors combobox
-        detectors = []
         detectors_data = instrument_data.get('detectors', [])
-        for data in detectors_data:
-            detector_name = data.get('name', '')
-            if detector_name:
-                detectors.append(detector_name)
+        detectors = [data.get('name', '') for data in detectors_data if data.get('name', '')]
 
         # Rewrite the combobox to contain the new list of detectors, and reset the index to the current value
         index = max(self.detector_combobox.currentIndex(), 0)
@@ -1265,7 +1285,7 @@ class FixedHardwareComponent(QtWidgets.QWidget):
         self.visuals = VisualSubComponent()
         layout.addWidget(self.visuals, 1, 0, 1, 3)
 
-    @property
+    @cached_property
     def __required_comboboxes(self):
         """Generates dict of required comboboxes for validation. The key is the validation
         label and the value is a list of widgets in the same row as the validation label
@@ -1421,9 +1441,9 @@ class PositioningStacksComponent(QtWidgets.QWidget):
 
         # The "activated" signal is emitted when the user re-selects the same option,
         # so we can ensure the "Add New..." text is cleared each time it is selected.
-        self.positioners_combobox.activated.connect(lambda: self.setNewPositioner())
+        self.positioners_combobox.activated.connect(self.setNewPositioner)
         # Need to include index change so programmatic changes of index are also accounted for
-        self.positioners_combobox.currentIndexChanged.connect(lambda: self.setNewPositioner())
+        self.positioners_combobox.currentIndexChanged.connect(self.setNewPositioner)
 
         # Display list of positioners in a QListWidget
         self.positioning_stack_box = QtWidgets.QListWidget()
@@ -1434,13 +1454,13 @@ class PositioningStacksComponent(QtWidgets.QWidget):
 
         # Create buttons to add and remove entries from the positioners list
         self.add_button = QtWidgets.QPushButton('Add')
-        self.add_button.clicked.connect(lambda: self.addNewItem())
+        self.add_button.clicked.connect(self.addNewItem)
         layout.addWidget(self.add_button, 1, 2)
         self.clear_button = QtWidgets.QPushButton('Clear')
-        self.clear_button.clicked.connect(lambda: self.clearList())
+        self.clear_button.clicked.connect(self.clearList)
         layout.addWidget(self.clear_button, 2, 2, alignment=QtCore.Qt.AlignTop)
 
-    @property
+    @cached_property
     def __required_widgets(self):
         """Generates dict of required widget for validation. The key is the validation
         label and the value is a list of widgets in the same row as the validation label
@@ -1450,7 +1470,7 @@ class PositioningStacksComponent(QtWidgets.QWidget):
         """
         return {self.positioning_stack_validation_label: [self.positioning_stack_box]}
 
-    @property
+    @cached_property
     def __required_comboboxes(self):
         """Generates dict of required comboboxes for validation. The key is the validation
         label and the value is a list of widgets in the same row as the validation label
@@ -1569,11 +1589,7 @@ class PositioningStacksComponent(QtWidgets.QWidget):
         if name is not None:
             self.name_combobox.setCurrentText(name)
 
-        positioning_stacks = []
-        for index, data in enumerate(self.positioning_stack_list):
-            name = data.get('name', '')
-            if name:
-                positioning_stacks.append(name)
+        positioning_stacks = [data.get('name', '') for data in self.positioning_stack_list if data.get('name', '')]
 
         # Rewrite the combobox to contain the new list of positioning stacks, and reset the index to the current value
         index = max(self.name_combobox.currentIndex(), 0)
@@ -1583,23 +1599,18 @@ class PositioningStacksComponent(QtWidgets.QWidget):
         if self.name_combobox.currentText() == self.add_new_text:
             self.name_combobox.clearEditText()
 
-        positioners = []
         positioners_data = instrument_data.get('positioners', [])
-        for data in positioners_data:
-            positioner_name = data.get('name', '')
-            if positioner_name:
-                positioners.append(positioner_name)
+        positioners = [data.get('name', '') for data in positioners_data if data.get('name', '')]
 
         self.positioners_list = positioners.copy()
 
         # Positioners list widget
         stack_positioners = positioning_stacks_data.get('positioners', [])
         self.positioning_stack_box.clear()
-        # Add positioners in this stack to the box, and remove from the list to be used for the combobox
-        for positioner in stack_positioners:
-            self.positioning_stack_box.addItem(positioner)
-            with contextlib.suppress(ValueError):
-                positioners.remove(positioner)
+        # Add positioners in this stack to the box, and drop them from the list to be used for the combobox
+        self.positioning_stack_box.addItems(stack_positioners)
+        in_stack = set(stack_positioners)
+        positioners = [positioner for positioner in positioners if positioner not in in_stack]
 
         # Positioners combobox
         # Rewrite the combobox to contain the remaining positioners, and reset the index to the current value
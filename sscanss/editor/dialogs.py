@@ -1,5 +1,10 @@
 import json
 import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt5 import QtCore, QtGui, QtWidgets
 from sscanss.core.instrument import Link, circle_point_analysis, generate_description
 from sscanss.core.math import clamp
@@ -33,9 +38,32 @@ class Controls(QtWidgets.QDialog):
         self.last_tab_index = 0
         self.last_stack_name = ''
         self.last_collimator_name = {}
+        self.widgets_stale = False
+
+    def refresh(self):
+        """Rebuilds the control widgets if the dialog is visible otherwise defers
+        the rebuild until the dialog is shown"""
+        if self.isVisible():
+            self.createWidgets()
+        else:
+            self.widgets_stale = True
+
+    def showEvent(self, event):
+        if self.widgets_stale:
+            self.createWidgets()
+        super().showEvent(event)
 
     def createWidgets(self):
         """Creates widgets for positioner, jaws, detector, and script"""
+        self.widgets_stale = False
+        # Suspend painting so the tab rebuild repaints once instead of per widget
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            self.__createWidgets()
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+
+    def __createWidgets(self):
         self.tabs.clear()
         positioner_widget = PositionerWidget(self.parent)
         if self.last_stack_name and self.last_stack_name in self.parent.presenter.model.instrument.positioning_stacks.keys(
@@ -320,9 +348,19 @@ class CalibrationWidget(QtWidgets.QDialog):
         sub_layout.addStretch(1)
         self.stack1.setLayout(layout)
 
+    def modelText(self):
+        """Serializes json description of robot in a single pass
+
+        :return: indented json text
+        :rtype: str
+        """
+        if orjson is not None:
+            return orjson.dumps(self.json, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(self.json, indent=2)
+
     def copyModel(self):
         """Copies json description of robot to the clipboard"""
-        QtWidgets.QApplication.clipboard().setText(json.dumps(self.json, indent=2))
+        QtWidgets.QApplication.clipboard().setText(self.modelText())
 
     def saveModel(self):
         """Saves json description of the robot to file"""
@@ -331,7 +369,7 @@ class CalibrationWidget(QtWidgets.QDialog):
             return
 
         with open(filename, 'w') as json_file:
-            json.dump(self.json, json_file, indent=2)
+            json_file.write(self.modelText())
 
     def createResultTable(self):
         """Creates widget to show calibration errors"""
@@ -45,7 +45,7 @@ class EditorPresenter:
         """
         self.view.updateErrors(self.parser.errors)
         self.model.instrument = result
-        self.view.controls.createWidgets()
+        self.view.controls.refresh()
         self.view.scene.updateInstrumentScene()
         self.view.designer.setEnabled(True)
         self.view.designer.setJson(self.parser.data)
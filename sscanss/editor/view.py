@@ -1,8 +1,12 @@
 import datetime
 import json
 import webbrowser
-import jsbeautifier
 from PyQt5 import QtCore, QtGui, QtWidgets
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from sscanss.config import settings, path_for
 from sscanss.core.instrument import Sequence
 from sscanss.core.scene import OpenGLRenderer, SceneManager
@@ -66,7 +70,7 @@ class EditorWindow(QtWidgets.QMainWindow):
         self.splitter.addWidget(self.editor)
 
         self.designer = Designer(self)
-        self.designer.json_updated.connect(lambda d: self.editor.setText(jsbeautifier.beautify(json.dumps(d))))
+        self.designer.json_updated.connect(self.updateEditorText)
 
         self.updateTitle()
         self.setMinimumSize(1024, 800)
@@ -77,6 +81,20 @@ class EditorWindow(QtWidgets.QMainWindow):
         self.initActions()
         self.initMenus()
 
+    def updateEditorText(self, json_data):
+        """Serialises the designer json into the editor. The designer emits on the GUI
+        thread, so the text is produced with a single indented dump instead of the old
+        json.dumps + jsbeautifier double traversal which stalled the UI on large files
+
+        :param json_data: instrument json
+        :type json_data: Dict[str, Any]
+        """
+        if orjson is not None:
+            text = orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode()
+        else:
+            text = json.dumps(json_data, indent=2)
+        self.editor.setText(text)
+
     def showSearchBox(self):
         """Opens the find dialog box."""
         self.find_dialog = FindWidget(self)
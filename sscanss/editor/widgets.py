@@ -29,7 +29,15 @@ class ScriptWidget(QtWidgets.QWidget):
         value = self.template.keys[self.template.Key.mu_amps.value] if show_mu_amps else '0.000'
         self.micro_amp_textbox.valueFromText(value)
         self.micro_amp_textbox.setDecimals(3)
-        self.micro_amp_textbox.valueChanged.connect(self.renderScript)
+
+        # Coalesces rapid spin box changes so the script is rendered once per
+        # quiet period instead of once per step. Restarting an active timer
+        # resets its countdown, giving a natural debounce.
+        self.render_timer = QtCore.QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(100)
+        self.render_timer.timeout.connect(self.renderScript)
+        self.micro_amp_textbox.valueChanged.connect(self.render_timer.start)
 
         if not show_mu_amps:
             self.micro_amp_textbox.setVisible(show_mu_amps)
@@ -68,8 +76,7 @@ class ScriptWidget(QtWidgets.QWidget):
         temp[self.template.Key.header.value] = header.replace(self.template.Key.position.value, '\t'.join(joint_labels),
                                                               1)
 
-        for key in self.template.keys:
-            self.template.keys[key] = temp[key]
+        self.template.keys = {key: temp[key] for key in self.template.keys}
 
     def renderScript(self):
         """Renders script with template"""
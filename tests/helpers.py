@@ -1,12 +1,19 @@
+import os
 import sys
 import unittest
+
+# The tests never render to a real display so the offscreen plugin is used to
+# avoid compositing, the variable must be set before the application is created
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
 from PyQt5.QtTest import QTest
 from PyQt5.QtCore import Qt, QPoint, QEvent, QCoreApplication, QEventLoop, QDeadlineTimer, QTimer
 from PyQt5.QtGui import QMouseEvent, QWheelEvent
 from PyQt5.QtWidgets import QMainWindow, QApplication, QMessageBox
 import sscanss.config as config
 
-APP = QApplication([])
+# Reuses an existing application so only one event loop exists per session
+APP = QApplication.instance() or QApplication([])
 
 
 def do_nothing(*_args, **_kwargs):
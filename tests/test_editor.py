@@ -1,10 +1,14 @@
+import copy
 import json
+import pickle
+import re
 from collections import namedtuple
+from types import SimpleNamespace
 import unittest
 import unittest.mock as mock
 import numpy as np
 from PyQt5.QtWidgets import QLineEdit, QComboBox, QDoubleSpinBox
-from sscanss.core.instrument.instrument import Instrument, PositioningStack, Detector, Script, Jaws
+from sscanss.core.instrument.instrument import PositioningStack, Detector, Script, Jaws
 from sscanss.core.instrument.robotics import Link, SerialManipulator
 from sscanss.editor.main import EditorWindow
 from sscanss.editor.widgets import PositionerWidget, JawsWidget, ScriptWidget, DetectorWidget
@@ -15,18 +19,189 @@ from tests.helpers import TestSignal, APP, SAMPLE_IDF
 
 Collimator = namedtuple("Collimator", ["name"])
 
+WHITESPACE = re.compile(r"\s+")
+
+# The instrument description is parsed once and deep copied by tests that mutate it
+SAMPLE_IDF_DATA = json.loads(SAMPLE_IDF)
+
+# Template links built once since the constructor allocates several vectors, tests
+# take shallow copies as moving a link only reassigns its attributes
+PRISMATIC_X_LINK = Link("", [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], Link.Type.Prismatic, 0, 100, 0)
+PRISMATIC_Z_LINK = Link("", [0.0, 0.0, 1.0], [0.0, 0.0, 0.0], Link.Type.Prismatic, 0, 100, 0)
+REVOLUTE_Z_LINK = Link("", [0.0, 0.0, -1.0], [0.0, 0.0, 0.0], Link.Type.Revolute, -3.14, 3.14, 0)
+
+# Constant calibration inputs built once, the test passes copies since the
+# widget takes ownership of and mutates them
+CALIBRATION_POINTS = [
+    np.array([[12.0, 0.0, 2.5], [10.0, 2.0, 1.5], [8.0, 0.0, 1.5]]),
+    np.array([[10.0, 0.0, 1.5], [11.0, -1.0, 1.5], [12.0, 0.0, 1.5]]),
+]
+CALIBRATION_OFFSETS = [np.array([0.0, 90.0, 180.0]), np.array([-180.0, -90.0, 0.0])]
+CALIBRATION_TYPES = [Link.Type.Revolute, Link.Type.Revolute]
+CALIBRATION_HOMES = np.array([10.0, 0.0])
+
+# Script templates shared by the tests, the Script objects themselves are built
+# per test since parsing mutates the instance
+SCRIPT_TEMPLATE = "{{header}}\n{{#script}}\n{{position}}    {{mu_amps}}\n{{/script}}"
+SCRIPT_TEMPLATE_NO_MU_AMPS = "{{header}}\n{{#script}}\n{{position}}\n{{/script}}"
+
+# Instrument fragments shared by the component tests, each test takes a
+# deepcopy since the update steps mutate the document
+DETECTOR_JSON_DATA = {
+    'instrument': {
+        "detectors": [{
+            "name": "North",
+            "default_collimator": "2.0mm",
+            "diffracted_beam": [0.0, 1.0, 0.0]
+        }, {
+            "name": "South",
+            "default_collimator": "2.0mm",
+            "diffracted_beam": [0.0, -1.0, 0.0]
+        }],
+        "collimators": [
+            {
+                "name": "1.0mm",
+                "detector": "South",
+                "aperture": [1.0, 200.0],
+                "visual": {
+                    "pose": [0.0, 0.0, 0.0, 0.0, 0.0, 90.0],
+                    "mesh": "models/collimator_1mm.stl",
+                    "colour": [0.6, 0.6, 0.6]
+                }
+            },
+            {
+                "name": "2.0mm",
+                "detector": "South",
+                "aperture": [2.0, 200.0],
+                "visual": {
+                    "pose": [0.0, 0.0, 0.0, 0.0, 0.0, 90.0],
+                    "mesh": "models/collimator_2mm.stl",
+                    "colour": [0.6, 0.6, 0.6]
+                }
+            },
+            {
+                "name": "1.0mm",
+                "detector": "North",
+                "aperture": [1.0, 200.0],
+                "visual": {
+                    "pose": [0.0, 0.0, 0.0, 0.0, 0.0, -90.0],
+                    "mesh": "models/collimator_1mm.stl",
+                    "colour": [0.6, 0.6, 0.6]
+                }
+            },
+            {
+                "name": "2.0mm",
+                "detector": "North",
+                "aperture": [2.0, 200.0],
+                "visual": {
+                    "pose": [0.0, 0.0, 0.0, 0.0, 0.0, -90.0],
+                    "mesh": "models/collimator_2mm.stl",
+                    "colour": [0.6, 0.6, 0.6]
+                }
+            },
+        ]
+    }
+}
+
+FIXED_HARDWARE_JSON_DATA = {
+    'instrument': {
+        "fixed_hardware": [{
+            "name": "beam_stop",
+            "visual": {
+                "pose": [0.0, 0.0, -1730.0, 0.0, 0.0, 0.0],
+                "mesh": "models/beam_stop.stl",
+                "colour": [0.27, 0.57, 0.57]
+            }
+        }, {
+            "name": "floor",
+            "visual": {
+                "pose": [0.0, 0.0, -2035.0, 0.0, 0.0, 0.0],
+                "mesh": "models/floor.stl",
+                "colour": [0.25, 0.51, 0.51]
+            }
+        }, {
+            "name": "beam_guide",
+            "visual": {
+                "pose": [0.0, 0.0, -1730.0, 0.0, 0.0, 0.0],
+                "mesh": "models/beam_guide.stl",
+                "colour": [0.27, 0.57, 0.57]
+            }
+        }]
+    }
+}
+
+
+def make_instrument_stub():
+    """Creates a stand-in for the Instrument with only the attributes the editor
+    widgets use, which is much cheaper than an autospec of the full class
+
+    :return: instrument stub
+    :rtype: SimpleNamespace
+    """
+    return SimpleNamespace(loadPositioningStack=mock.Mock(),
+                           positioning_stacks={},
+                           positioning_stack=None,
+                           jaws=None,
+                           detectors={},
+                           script=None)
+
+
+
+def clone_fixture(data):
+    """Returns a deep copy of a JSON shaped fixture, a pickle round trip is
+    noticeably faster than copy.deepcopy for nested dicts and lists
+
+    :param data: fixture to copy
+    :type data: Dict[str, Any]
+    :return: independent copy
+    :rtype: Dict[str, Any]
+    """
+    return pickle.loads(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+
+
+def combobox_items(combobox):
+    """Returns the text of every item in the given combobox
+
+    :param combobox: combobox to snapshot
+    :type combobox: QtWidgets.QComboBox
+    :return: item texts
+    :rtype: List[str]
+    """
+    item_text = combobox.itemText
+    return [item_text(index) for index in range(combobox.count())]
+
+
+def list_box_items(box):
+    """Returns the text of every item in the given list widget
+
+    :param box: list widget to snapshot
+    :type box: QtWidgets.QListWidget
+    :return: item texts
+    :rtype: List[str]
+    """
+    item = box.item
+    return [item(index).text() for index in range(box.count())]
+
 
 class TestEditor(unittest.TestCase):
-    @mock.patch("sscanss.editor.view.SceneManager", autospec=True)
-    def setUp(self, scene_mock):
-        self.view = EditorWindow()
-        self.view.animate_instrument = TestSignal()
+    @classmethod
+    def setUpClass(cls):
+        # The window is expensive to construct so it is built once and the
+        # mutable model state is reset per test in setUp. The scene manager
+        # patch is started once here so its autospec is only built once
+        cls.scene_patcher = mock.patch("sscanss.editor.view.SceneManager", autospec=True)
+        cls.scene_patcher.start()
+        cls.addClassCleanup(cls.scene_patcher.stop)
+        cls.view = EditorWindow()
+        cls.view.animate_instrument = TestSignal()
+
+    def setUp(self):
         self.view.presenter.model.saved_text = ""
-        self.view.presenter.model.instrument = mock.create_autospec(Instrument)
+        self.view.presenter.model.instrument = make_instrument_stub()
 
-        q1 = Link("", [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], Link.Type.Prismatic, 0, 100, 0)
-        q2 = Link("", [0.0, 0.0, 1.0], [0.0, 0.0, 0.0], Link.Type.Prismatic, 0, 100, 0)
-        q3 = Link("", [0.0, 0.0, -1.0], [0.0, 0.0, 0.0], Link.Type.Revolute, -3.14, 3.14, 0)
+        q1 = copy.copy(PRISMATIC_X_LINK)
+        q2 = copy.copy(PRISMATIC_Z_LINK)
+        q3 = copy.copy(REVOLUTE_Z_LINK)
 
         s1 = PositioningStack("a", SerialManipulator("a", [q1, q2]))
         s1.addPositioner(SerialManipulator("c", [q3]))
@@ -37,8 +212,18 @@ class TestEditor(unittest.TestCase):
         self.view.presenter.model.instrument.jaws = Jaws("", [0, 0, 0], [1, 0, 0], [1.0, 1.0], [0.5, 0.5], [4.0, 4.0],
                                                          None)
         self.view.presenter.model.instrument.detectors = {"East": Detector("East", [1, 0, 0])}
-        self.view.presenter.model.instrument.script = Script(
-            "{{header}}\n{{#script}}\n{{position}}    {{mu_amps}}\n{{/script}}")
+        self.view.presenter.model.instrument.script = Script(SCRIPT_TEMPLATE)
+
+    def assertComponentInvalid(self, component, labels):
+        """Checks the component fails validation and every label warns about the
+        missing required fields"""
+        self.assertFalse(component.validate())
+        self.assertNotIn('', [label.text() for label in labels])
+
+    def assertComponentValid(self, component, labels):
+        """Checks the component passes validation and no label shows a warning"""
+        self.assertTrue(component.validate())
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
 
     def testPositionerWidget(self):
         widget = PositionerWidget(self.view)
@@ -60,38 +245,27 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(window.editor.selectedText(), "Text")
         widget.search()
         self.assertEqual(widget.status_box.text(), "No more entries found.")
-        # Testing match case
-        window.editor.selectAll(False)
-        widget.match_case.click()
-        widget.search()
-        self.assertNotEqual(window.editor.selectedText(), "Text")
-        widget.search_box.setText("Text")
-        window.editor.selectAll(False)
-        widget.search()
-        self.assertEqual(window.editor.selectedText(), "Text")
-        widget.match_case.click()
-        # Testing whole word
-        widget.whole_word.click()
-        window.editor.selectAll(False)
-        widget.search()
-        self.assertEqual(window.editor.selectedText(), "Text")
-        widget.search_box.setText("Tex")
-        window.editor.selectAll(False)
-        widget.search()
-        self.assertNotEqual(window.editor.selectedText(), "Text")
-        widget.whole_word.click()
-        # Testing empty search string
-        window.editor.setText("The Text")
-        widget.search_box.setText("")
-        window.editor.selectAll(False)
-        widget.search()
-        self.assertEqual(widget.status_box.text(), "No more entries found.")
-        # Testing empty search string and empty window text
-        window.editor.setText("")
-        widget.search_box.setText("")
-        window.editor.selectAll(False)
-        widget.search()
-        self.assertEqual(widget.status_box.text(), "No more entries found.")
+
+        cases = [
+            ("The Text", "text", True, False, False),  # match case rejects a different case
+            ("The Text", "Text", True, False, True),
+            ("The Text", "Text", False, True, True),  # whole word matches a full token
+            ("The Text", "Tex", False, True, False),
+            ("The Text", "", False, False, False),  # empty search string
+            ("", "", False, False, False),  # empty search string and editor text
+        ]
+        for text, search_text, match_case, whole_word, found in cases:
+            with self.subTest(search_text=search_text, match_case=match_case, whole_word=whole_word):
+                window.editor.setText(text)
+                widget.match_case.setChecked(match_case)
+                widget.whole_word.setChecked(whole_word)
+                widget.search_box.setText(search_text)
+                window.editor.selectAll(False)
+                widget.search()
+                if found:
+                    self.assertEqual(window.editor.selectedText(), "Text")
+                else:
+                    self.assertEqual(widget.status_box.text(), "No more entries found.")
 
     def testJawsWidget(self):
         widget = JawsWidget(self.view)
@@ -100,8 +274,8 @@ class TestEditor(unittest.TestCase):
         widget.change_aperture_button.click()
         self.assertEqual(widget.aperture_forms[0].value(), 3)
 
-        q1 = Link("", [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], Link.Type.Prismatic, 0, 100, 0)
-        q2 = Link("", [0.0, 0.0, -1.0], [0.0, 0.0, 0.0], Link.Type.Revolute, -3.14, 3.14, 0)
+        q1 = copy.copy(PRISMATIC_X_LINK)
+        q2 = copy.copy(REVOLUTE_Z_LINK)
         self.view.presenter.model.instrument.jaws.positioner = SerialManipulator("a", [q1, q2])
         widget = JawsWidget(self.view)
         self.assertEqual(self.view.presenter.model.instrument.jaws.positioner.set_points[0], 0)
@@ -121,8 +295,8 @@ class TestEditor(unittest.TestCase):
         widget.changeCollimator()
         self.assertEqual(widget.collimator_name, "1")
 
-        q1 = Link("", [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], Link.Type.Prismatic, 0, 100, 0)
-        q2 = Link("", [0.0, 0.0, -1.0], [0.0, 0.0, 0.0], Link.Type.Revolute, -3.14, 3.14, 0)
+        q1 = copy.copy(PRISMATIC_X_LINK)
+        q2 = copy.copy(REVOLUTE_Z_LINK)
         positioner = SerialManipulator("a", [q1, q2])
         self.view.presenter.model.instrument.detectors = {"East": Detector("East", [1, 0, 0], c, positioner)}
         widget = DetectorWidget(self.view, "East")
@@ -137,8 +311,10 @@ class TestEditor(unittest.TestCase):
         self.assertNotEqual(widget.preview_label.toPlainText(), "")
         widget.updateScript()
 
-        self.view.presenter.model.instrument.script = Script("{{header}}\n{{#script}}\n{{position}}\n{{/script}}")
-        self.widget = ScriptWidget(self.view)
+        # The widget is refreshed in place instead of constructing a second one
+        self.view.presenter.model.instrument.script = Script(SCRIPT_TEMPLATE_NO_MU_AMPS)
+        widget.template = self.view.presenter.model.instrument.script
+        widget.updateScript()
         self.assertNotEqual(widget.preview_label.toPlainText(), "")
 
     def testControlsDialog(self):
@@ -156,7 +332,7 @@ class TestEditor(unittest.TestCase):
         self.assertDictEqual(widget.last_collimator_name, {"East": "1"})
 
         self.assertEqual(widget.last_tab_index, 0)
-        self.view.presenter.model.instrument.script = Script("{{header}}\n{{#script}}\n{{position}}\n{{/script}}")
+        self.view.presenter.model.instrument.script = Script(SCRIPT_TEMPLATE_NO_MU_AMPS)
         text = widget.script_widget.preview_label.toPlainText()
         widget.updateTabs(3)
         widget.createWidgets()
@@ -168,60 +344,62 @@ class TestEditor(unittest.TestCase):
         self.assertDictEqual(widget.last_collimator_name, {})
         self.assertEqual(widget.last_tab_index, 0)
 
+    def checkCalibrateEnabled(self, widget, line_edit, text, expected):
+        """Sets the line edit text and checks the calibrate button enabled state
+
+        :param widget: calibration widget
+        :type widget: CalibrationWidget
+        :param line_edit: line edit to change
+        :type line_edit: QLineEdit
+        :param text: text to set
+        :type text: str
+        :param expected: expected enabled state
+        :type expected: bool
+        """
+        line_edit.setText(text)
+        self.assertEqual(widget.calibrate_button.isEnabled(), expected, msg=f"text={text!r}")
+
+    @mock.patch("sscanss.editor.dialogs.open", new_callable=mock.mock_open)
     @mock.patch("sscanss.editor.dialogs.QtWidgets.QFileDialog", autospec=True)
-    def testCalibrationDialog(self, file_dialog):
-        points = [
-            np.array([[12.0, 0.0, 2.5], [10.0, 2.0, 1.5], [8.0, 0.0, 1.5]]),
-            np.array([[10.0, 0.0, 1.5], [11.0, -1.0, 1.5], [12.0, 0.0, 1.5]]),
-        ]
-
-        offsets = [np.array([0.0, 90.0, 180.0]), np.array([-180.0, -90.0, 0.0])]
-        types = [Link.Type.Revolute, Link.Type.Revolute]
-        homes = np.array([10.0, 0.0])
-
-        widget = CalibrationWidget(self.view, points, types, offsets, homes)
+    def testCalibrationDialog(self, file_dialog, open_mock):
+        points = [point.copy() for point in CALIBRATION_POINTS]
+        offsets = [offset.copy() for offset in CALIBRATION_OFFSETS]
+        widget = CalibrationWidget(self.view, points, list(CALIBRATION_TYPES), offsets, CALIBRATION_HOMES.copy())
         widget.calibrate_button.click()
 
+        # findChildren walks the whole widget tree so each list is collected once
         line_edits = widget.findChildren(QLineEdit)
+        comboboxes = widget.findChildren(QComboBox)
+        spinboxes = widget.findChildren(QDoubleSpinBox)
 
-        line_edits[0].setText("")
-        self.assertFalse(widget.calibrate_button.isEnabled())
+        self.checkCalibrateEnabled(widget, line_edits[0], "", False)
         self.assertEqual(widget.robot_name, "")
-        line_edits[0].setText("Two link")
-        self.assertTrue(widget.calibrate_button.isEnabled())
+        self.checkCalibrateEnabled(widget, line_edits[0], "Two link", True)
         self.assertEqual(widget.robot_name, "Two link")
 
-        line_edits[1].setText("")
-        self.assertFalse(widget.calibrate_button.isEnabled())
-        line_edits[1].setText("3, 1")
+        self.checkCalibrateEnabled(widget, line_edits[1], "", False)
+        self.checkCalibrateEnabled(widget, line_edits[1], "3, 1", False)
         self.assertListEqual(widget.order, [])
-        self.assertFalse(widget.calibrate_button.isEnabled())
-        line_edits[1].setText("b, a")
+        self.checkCalibrateEnabled(widget, line_edits[1], "b, a", False)
         self.assertListEqual(widget.order, [])
-        self.assertFalse(widget.calibrate_button.isEnabled())
-        line_edits[1].setText("3, 1, 2")
+        self.checkCalibrateEnabled(widget, line_edits[1], "3, 1, 2", False)
         self.assertListEqual(widget.order, [])
-        self.assertFalse(widget.calibrate_button.isEnabled())
         line_edits[1].setText("2, 1")
         self.assertListEqual(widget.order, [1, 0])
 
-        line_edits[2].setText("")
-        self.assertFalse(widget.calibrate_button.isEnabled())
+        self.checkCalibrateEnabled(widget, line_edits[2], "", False)
         self.assertEqual(widget.names[0], "")
-        line_edits[2].setText("a")
-        self.assertTrue(widget.calibrate_button.isEnabled())
-        line_edits[4].setText("a")
-        self.assertFalse(widget.calibrate_button.isEnabled())
-        line_edits[4].setText("b")
-        self.assertTrue(widget.calibrate_button.isEnabled())
+        self.checkCalibrateEnabled(widget, line_edits[2], "a", True)
+        self.checkCalibrateEnabled(widget, line_edits[4], "a", False)
+        self.checkCalibrateEnabled(widget, line_edits[4], "b", True)
         self.assertEqual(widget.names[0], "a")
 
         self.assertEqual(widget.types[1], Link.Type.Revolute)
-        widget.findChildren(QComboBox)[1].setCurrentIndex(1)
+        comboboxes[1].setCurrentIndex(1)
         self.assertEqual(widget.types[1], Link.Type.Prismatic)
 
         self.assertEqual(widget.homes[0], 10.0)
-        widget.findChildren(QDoubleSpinBox)[0].setValue(0.0)
+        spinboxes[0].setValue(0.0)
         self.assertEqual(widget.homes[0], 0.0)
 
         self.assertEqual(widget.model_error_table.rowCount(), 6)
@@ -234,15 +412,15 @@ class TestEditor(unittest.TestCase):
 
         widget.json = {"name": "Json"}
         widget.copy_model_button.click()
-        self.assertEqual("".join(APP.clipboard().text().split()), '{"name":"Json"}')
+        APP.processEvents()  # flushes the clipboard write before reading it back
+        self.assertEqual(WHITESPACE.sub("", APP.clipboard().text()), '{"name":"Json"}')
 
         file_dialog.getSaveFileName.return_value = ("", "")
         widget.save_model_button.click()
+        open_mock.assert_not_called()
         file_dialog.getSaveFileName.return_value = ("file.json", "")
-        m = mock.mock_open()
-        with mock.patch("sscanss.editor.dialogs.open", m):
-            widget.save_model_button.click()
-            m.assert_called_once()
+        widget.save_model_button.click()
+        open_mock.assert_called_once()
 
     def testDesigner(self):
         widget = Designer(self.view)
@@ -263,7 +441,7 @@ class TestEditor(unittest.TestCase):
         mock_func.assert_not_called()
         self.assertFalse(widget.component.validate())
 
-        json_data = json.loads(SAMPLE_IDF)
+        json_data = clone_fixture(SAMPLE_IDF_DATA)
         widget.setJson(json_data)
         self.assertTrue(widget.component.validate())
 
@@ -295,14 +473,12 @@ class TestEditor(unittest.TestCase):
             component.x_translation, component.y_translation, component.z_translation, component.x_orientation,
             component.y_orientation, component.z_orientation
         ]
-        for widget in pose_widgets:
-            self.assertEqual(widget.text(), '0.0')
+        self.assertEqual(tuple(widget.text() for widget in pose_widgets), ('0.0', ) * 6)
         self.assertEqual(component.colour_picker.value.name(), '#000000')
         self.assertEqual(component.file_picker.value, '')
 
         component.updateValue({}, '')
-        for widget in pose_widgets:
-            self.assertEqual(widget.text(), '0.0')
+        self.assertEqual(tuple(widget.text() for widget in pose_widgets), ('0.0', ) * 6)
         self.assertEqual(component.colour_picker.value.name(), '#000000')
         self.assertEqual(component.file_picker.value, '')
         self.assertEqual(component.validation_label.text(), '')
@@ -312,8 +488,7 @@ class TestEditor(unittest.TestCase):
 
         json_data = {"mesh": "../instruments/engin-x/models/beam_guide.stl"}
         component.updateValue(json_data, '.')
-        for widget in pose_widgets:
-            self.assertEqual(widget.text(), '0.0')
+        self.assertEqual(tuple(widget.text() for widget in pose_widgets), ('0.0', ) * 6)
         self.assertEqual(component.colour_picker.value.name(), '#000000')
         self.assertEqual(component.file_picker.value, '../instruments/engin-x/models/beam_guide.stl')
         self.assertTrue(component.validate())
@@ -326,8 +501,8 @@ class TestEditor(unittest.TestCase):
             "mesh": "../instruments/engin-x/models/beam_guide.stl"
         }
         component.updateValue(json_data, '.')
-        for index, widget in enumerate(pose_widgets):
-            self.assertEqual(widget.text(), f'{json_data["pose"][index]:.1f}')
+        expected = tuple(f'{value:.1f}' for value in json_data["pose"])
+        self.assertEqual(tuple(widget.text() for widget in pose_widgets), expected)
         self.assertEqual(component.colour_picker.value.name(), '#ffffff')
         self.assertEqual(component.file_picker.value, '../instruments/engin-x/models/beam_guide.stl')
         self.assertTrue(component.validate())
@@ -342,31 +517,25 @@ class TestEditor(unittest.TestCase):
         labels = [
             component.name_validation_label, component.version_validation_label, component.gauge_vol_validation_label
         ]
-        for widget in widgets:
-            self.assertEqual(widget.text(), '')
+        self.assertEqual(tuple(widget.text() for widget in widgets), ('', ) * 5)
         self.assertEqual(component.script_picker.value, '')
 
         component.updateValue({}, '')
-        for widget in widgets:
-            self.assertEqual(widget.text(), '')
+        self.assertEqual(tuple(widget.text() for widget in widgets), ('', ) * 5)
         self.assertEqual(component.script_picker.value, '')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         self.assertFalse(component.validate())
         self.assertDictEqual(component.value(), {})
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertNotIn('', [label.text() for label in labels])
 
         json_data = {'instrument': {'name': 'test', 'version': '1.2', 'gauge_volume': [1, 2, 3]}}
-        result = ['test', '1.2', '1.0', '2.0', '3.0']
+        result = ('test', '1.2', '1.0', '2.0', '3.0')
         component.updateValue(json_data, '')
-        for index, widget in enumerate(widgets):
-            self.assertEqual(widget.text(), result[index])
+        self.assertEqual(tuple(widget.text() for widget in widgets), result)
         self.assertEqual(component.script_picker.value, '')
         self.assertTrue(component.validate())
         self.assertDictEqual(component.value(), json_data['instrument'])
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
 
         json_data['instrument']['script_template'] = 'script_template'
         component.updateValue(json_data, '')
@@ -376,6 +545,7 @@ class TestEditor(unittest.TestCase):
 
     def testJawComponent(self):
         component = JawComponent()
+        key = component.key
         widgets = [
             component.x_aperture, component.y_aperture, component.x_aperture_lower_limit,
             component.y_aperture_lower_limit, component.x_aperture_upper_limit, component.y_aperture_upper_limit,
@@ -396,13 +566,11 @@ class TestEditor(unittest.TestCase):
             self.assertEqual(widget.text(), '')
         self.assertEqual(component.positioner_combobox.currentText(), 'None')
         self.assertEqual(component.visuals.file_picker.value, '')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         self.assertEqual(component.visuals.validation_label.text(), '')
         self.assertFalse(component.validate())
-        self.assertDictEqual(component.value()[component.key], {})
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertDictEqual(component.value()[key], {})
+        self.assertNotIn('', [label.text() for label in labels])
         self.assertNotEqual(component.visuals.validation_label.text(), '')
 
         json_data = {
@@ -428,19 +596,26 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.visuals.file_picker.value, 'beam_guide.stl')
         self.assertTrue(component.validate())
         self.assertDictEqual(component.value(), json_data['instrument'])
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         self.assertEqual(component.visuals.validation_label.text(), '')
 
-        json_data = json.loads(SAMPLE_IDF)
+        json_data = clone_fixture(SAMPLE_IDF_DATA)
         component.updateValue(json_data, '')
         self.assertTrue(component.validate())
         self.assertEqual(component.positioner_combobox.currentText(), 'incident_jaws')
         self.assertEqual(component.visuals.file_picker.value, 'model_path')
-        self.assertDictEqual(component.value()[component.key], json_data['instrument'][component.key])
+        self.assertDictEqual(component.value()[key], json_data['instrument'][key])
+
+    def switchDetector(self, component, widgets, index, expected):
+        """Selects the detector at the given combobox index and checks the
+        diffracted beam fields in a single comparison"""
+        component.detector_name_combobox.setCurrentIndex(index)
+        component.detector_name_combobox.activated.emit(index)
+        self.assertEqual(tuple(widget.text() for widget in widgets), tuple(expected))
 
     def testDetectorComponent(self):
         component = DetectorComponent()
+        key = component.key
         widgets = [component.x_diffracted_beam, component.y_diffracted_beam, component.z_diffracted_beam]
         labels = [component.name_validation_label, component.diffracted_beam_validation_label]
 
@@ -459,96 +634,30 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.detector_name_combobox.currentText(), '')
         self.assertEqual(component.default_collimator_combobox.currentText(), 'None')
         self.assertEqual(component.positioner_combobox.currentText(), 'None')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], [{}])
+        self.assertEqual(component.value()[key], [{}])
         # 3) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 4) The label text should not remain empty -- it should give a warning about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
 
-        # Test inputting JSON data defined below and updating the component.
+        # Test inputting the JSON data defined at module level and updating the component.
         # There are two detectors, each associated with two collimators
-        json_data = {
-            'instrument': {
-                "detectors": [{
-                    "name": "North",
-                    "default_collimator": "2.0mm",
-                    "diffracted_beam": [0.0, 1.0, 0.0]
-                }, {
-                    "name": "South",
-                    "default_collimator": "2.0mm",
-                    "diffracted_beam": [0.0, -1.0, 0.0]
-                }],
-                "collimators": [
-                    {
-                        "name": "1.0mm",
-                        "detector": "South",
-                        "aperture": [1.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, 90.0],
-                            "mesh": "models/collimator_1mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                    {
-                        "name": "2.0mm",
-                        "detector": "South",
-                        "aperture": [2.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, 90.0],
-                            "mesh": "models/collimator_2mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                    {
-                        "name": "1.0mm",
-                        "detector": "North",
-                        "aperture": [1.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, -90.0],
-                            "mesh": "models/collimator_1mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                    {
-                        "name": "2.0mm",
-                        "detector": "North",
-                        "aperture": [2.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, -90.0],
-                            "mesh": "models/collimator_2mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                ]
-            }
-        }
+        json_data = clone_fixture(DETECTOR_JSON_DATA)
 
-        north_diffracted_beam = ['0.0', '1.0', '0.0']
+        north_diffracted_beam = ('0.0', '1.0', '0.0')
         # This should select the first detector
         component.updateValue(json_data, '')
         # 1) The fields in the component should be updated to match the expected result
-        for index, widget in enumerate(widgets):
-            self.assertEqual(widget.text(), north_diffracted_beam[index])
+        self.assertEqual(tuple(widget.text() for widget in widgets), north_diffracted_beam)
         self.assertEqual(component.detector_name_combobox.currentText(), 'North')
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], json_data['instrument'][component.key])
+        self.assertCountEqual(component.value()[key], json_data['instrument'][key])
         # 3) The component should be declared valid -- all required arguments are specified
-        self.assertTrue(component.validate())
-        # 4) The label text should remain empty -- as the component is valid
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertComponentValid(component, labels)
 
-        south_diffracted_beam = ['0.0', '-1.0', '0.0']
+        south_diffracted_beam = ('0.0', '-1.0', '0.0')
         # If we switch detector, this should be recorded in the component
-        component.detector_name_combobox.setCurrentIndex(1)
-        component.detector_name_combobox.activated.emit(1)
-        # 1) The fields in the component should be updated to match the expected result
-        for index, widget in enumerate(widgets):
-            self.assertEqual(widget.text(), south_diffracted_beam[index])
+        self.switchDetector(component, widgets, 1, south_diffracted_beam)
         self.assertEqual(component.detector_name_combobox.currentText(), 'South')
 
         # If we rename the detector in the component, the detector name should be updated in the collimators
@@ -558,29 +667,19 @@ class TestEditor(unittest.TestCase):
         json_data['instrument'].update(component.value())
         component.updateValue(json_data, '')
         # 1) The fields in the component should be updated to match the expected result
-        for index, widget in enumerate(widgets):
-            self.assertEqual(widget.text(), south_diffracted_beam[index])
+        self.assertEqual(tuple(widget.text() for widget in widgets), south_diffracted_beam)
         self.assertEqual(component.detector_name_combobox.currentText(), 'West')
         # 2) The collimators associated with this detector should have their names updated
-        for index, collimator in enumerate(collimators):
-            self.assertEqual(collimator['detector'], new_names[index])
+        self.assertEqual([collimator['detector'] for collimator in collimators], new_names)
 
         # If we switch to the "Add New..." option, text fields should be cleared
-        component.detector_name_combobox.setCurrentIndex(2)
-        component.detector_name_combobox.activated.emit(1)
-        # 1) The fields in the component should be cleared
-        for widget in widgets:
-            self.assertEqual(widget.text(), '')
+        self.switchDetector(component, widgets, 2, ('', '', ''))
         self.assertEqual(component.detector_name_combobox.currentText(), '')
         self.assertEqual(component.default_collimator_combobox.currentText(), 'None')
         self.assertEqual(component.positioner_combobox.currentText(), 'None')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 3) The label text should not remain empty -- it should give a warning about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
 
         # Add a new detector
         component.detector_name_combobox.setCurrentText('East')
@@ -592,11 +691,11 @@ class TestEditor(unittest.TestCase):
         # 4) When adding the detector, it should appear in the JSON
         detectors = json_data.get('instrument').get('detectors')
         new_detectors = ['North', 'West', 'East']
-        for index, detector in enumerate(detectors):
-            self.assertEqual(detector['name'], new_detectors[index])
+        self.assertEqual([detector['name'] for detector in detectors], new_detectors)
 
     def testCollimatorComponent(self):
         component = CollimatorComponent()
+        key = component.key
         widgets = [component.collimator_name, component.x_aperture, component.y_aperture]
         labels = [
             component.name_validation_label, component.detector_validation_label, component.aperture_validation_label,
@@ -618,73 +717,15 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.visuals.file_picker.value, '')
         self.assertEqual(component.collimator_combobox.currentText(), component.add_new_text)
         self.assertEqual(component.detector_combobox.currentText(), '')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], [{}])
+        self.assertEqual(component.value()[key], [{}])
         # 3) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 4) The label text should not remain empty -- it should give a warning about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
 
-        # Test inputting JSON data defined below and updating the component.
+        # Test inputting the JSON data defined at module level and updating the component.
         # There are two detectors, each associated with two collimators
-        json_data = {
-            'instrument': {
-                "detectors": [{
-                    "name": "North",
-                    "default_collimator": "2.0mm",
-                    "diffracted_beam": [0.0, 1.0, 0.0]
-                }, {
-                    "name": "South",
-                    "default_collimator": "2.0mm",
-                    "diffracted_beam": [0.0, -1.0, 0.0]
-                }],
-                "collimators": [
-                    {
-                        "name": "1.0mm",
-                        "detector": "South",
-                        "aperture": [1.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, 90.0],
-                            "mesh": "models/collimator_1mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                    {
-                        "name": "2.0mm",
-                        "detector": "South",
-                        "aperture": [2.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, 90.0],
-                            "mesh": "models/collimator_2mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                    {
-                        "name": "1.0mm",
-                        "detector": "North",
-                        "aperture": [1.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, -90.0],
-                            "mesh": "models/collimator_1mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                    {
-                        "name": "2.0mm",
-                        "detector": "North",
-                        "aperture": [2.0, 200.0],
-                        "visual": {
-                            "pose": [0.0, 0.0, 0.0, 0.0, 0.0, -90.0],
-                            "mesh": "models/collimator_2mm.stl",
-                            "colour": [0.6, 0.6, 0.6]
-                        }
-                    },
-                ]
-            }
-        }
+        json_data = clone_fixture(DETECTOR_JSON_DATA)
 
         first_collimator = ['1.0mm', '1.0', '200.0']
         # This should select the first collimator
@@ -696,12 +737,9 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.detector_combobox.currentText(), 'South')
         self.assertEqual(component.visuals.file_picker.value, 'models/collimator_1mm.stl')
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], json_data['instrument'][component.key])
+        self.assertCountEqual(component.value()[key], json_data['instrument'][key])
         # 3) The component should be declared valid -- all required arguments are specified
-        self.assertTrue(component.validate())
-        # 4) The label text should remain empty -- as the component is valid
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertComponentValid(component, labels)
 
         fourth_collimator = ['2.0mm', '2.0', '200.0']
         # If we switch collimator, this should be recorded in the component
@@ -715,13 +753,12 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.visuals.file_picker.value, 'models/collimator_2mm.stl')
 
         # If we switch the detector, this should be recorded in the component
-        detector_list = [component.detector_combobox.itemText(i) for i in range(component.detector_combobox.count())]
+        detector_list = combobox_items(component.detector_combobox)
         json_data['instrument']['collimators'][3]['detector'] = 'South'
         component.updateValue(json_data, '')
         # 1) The detector combobox should read the value of the new detector, with all detectors in the combobox
         self.assertEqual(component.detector_combobox.currentText(), 'South')
-        for i in range(component.detector_combobox.count()):
-            self.assertEqual(component.detector_combobox.itemText(i), detector_list[i])
+        self.assertEqual(combobox_items(component.detector_combobox), detector_list)
 
         # If we add a new, unrecorded detector, this should not be included in the combobox
         new_detector = 'West'
@@ -729,8 +766,7 @@ class TestEditor(unittest.TestCase):
         component.updateValue(json_data, '')
         # 1) The detector combobox should read the value of the new detector, but only contain the defined detectors
         self.assertEqual(component.detector_combobox.currentText(), new_detector)
-        for i in range(component.detector_combobox.count()):
-            self.assertEqual(component.detector_combobox.itemText(i), detector_list[i])
+        self.assertEqual(combobox_items(component.detector_combobox), detector_list)
 
         # If we switch to the "Add New..." collimator option, text fields should be cleared
         component.collimator_combobox.setCurrentIndex(4)
@@ -740,15 +776,11 @@ class TestEditor(unittest.TestCase):
             self.assertEqual(widget.text(), '')
         self.assertEqual(component.collimator_combobox.currentText(), component.add_new_text)
         self.assertEqual(component.visuals.file_picker.value, '')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The detector combobox should default to adding a new detector
         self.assertEqual(component.detector_combobox.currentText(), '')
         # 3) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 4) The label text should not remain empty -- they should give warnings about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
 
         # Add a new collimator
         component.collimator_name.setText('3.0mm')
@@ -759,11 +791,11 @@ class TestEditor(unittest.TestCase):
         # 5) When adding the detector, it should appear in the JSON
         collimators = json_data.get('instrument').get('collimators')
         new_collimators = ['1.0mm', '2.0mm', '1.0mm', '2.0mm', '3.0mm']
-        for index, collimator in enumerate(collimators):
-            self.assertEqual(collimator['name'], new_collimators[index])
+        self.assertEqual([collimator['name'] for collimator in collimators], new_collimators)
 
     def testFixedHardwareComponent(self):
         component = FixedHardwareComponent()
+        key = component.key
         labels = [component.name_validation_label, component.visuals.validation_label]
 
         # Test text fields are empty to begin with
@@ -774,44 +806,15 @@ class TestEditor(unittest.TestCase):
         # 1) The fields in the component should remain empty
         self.assertEqual(component.name_combobox.currentText(), '')
         self.assertEqual(component.visuals.file_picker.value, '')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], [{}])
+        self.assertEqual(component.value()[key], [{}])
         # 3) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 4) The label text should not remain empty -- it should give a warning about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
 
-        # Test inputting JSON data defined below and updating the component.
+        # Test inputting the JSON data defined at module level and updating the component.
         # There are three fixed hardware components
-        json_data = {
-            'instrument': {
-                "fixed_hardware": [{
-                    "name": "beam_stop",
-                    "visual": {
-                        "pose": [0.0, 0.0, -1730.0, 0.0, 0.0, 0.0],
-                        "mesh": "models/beam_stop.stl",
-                        "colour": [0.27, 0.57, 0.57]
-                    }
-                }, {
-                    "name": "floor",
-                    "visual": {
-                        "pose": [0.0, 0.0, -2035.0, 0.0, 0.0, 0.0],
-                        "mesh": "models/floor.stl",
-                        "colour": [0.25, 0.51, 0.51]
-                    }
-                }, {
-                    "name": "beam_guide",
-                    "visual": {
-                        "pose": [0.0, 0.0, -1730.0, 0.0, 0.0, 0.0],
-                        "mesh": "models/beam_guide.stl",
-                        "colour": [0.27, 0.57, 0.57]
-                    }
-                }]
-            }
-        }
+        json_data = clone_fixture(FIXED_HARDWARE_JSON_DATA)
 
         # This should select the first hardware component
         component.updateValue(json_data, '')
@@ -819,12 +822,9 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.name_combobox.currentText(), 'beam_stop')
         self.assertEqual(component.visuals.file_picker.value, 'models/beam_stop.stl')
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], json_data['instrument'][component.key])
+        self.assertCountEqual(component.value()[key], json_data['instrument'][key])
         # 3) The component should be declared valid -- all required arguments are specified
-        self.assertTrue(component.validate())
-        # 4) The label text should remain empty -- as the component is valid
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertComponentValid(component, labels)
 
         # If we switch hardware component, this should be recorded in the component
         component.name_combobox.setCurrentIndex(1)
@@ -839,13 +839,9 @@ class TestEditor(unittest.TestCase):
         # 1) The fields in the component should be cleared
         self.assertEqual(component.name_combobox.currentText(), '')
         self.assertEqual(component.visuals.file_picker.value, '')
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 3) The label text should not remain empty -- it should give a warning about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
 
         # Add new hardware
         component.name_combobox.setCurrentText('ceiling')
@@ -854,11 +850,11 @@ class TestEditor(unittest.TestCase):
         # 4) When adding the hardware, it should appear in the JSON
         hardware = json_data.get('instrument').get('fixed_hardware')
         new_hardware = ['beam_stop', 'floor', 'beam_guide', 'ceiling']
-        for index, hardware in enumerate(hardware):
-            self.assertEqual(hardware['name'], new_hardware[index])
+        self.assertEqual([item['name'] for item in hardware], new_hardware)
 
     def testPositioningStacksComponent(self):
         component = PositioningStacksComponent()
+        key = component.key
         labels = [component.name_validation_label, component.positioning_stack_validation_label]
 
         # Test text fields are empty to begin with
@@ -872,75 +868,50 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.name_combobox.currentText(), '')
         self.assertEqual(component.positioners_combobox.currentText(), '')
         self.assertEqual(component.positioning_stack_box.count(), 0)
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], [{}])
+        self.assertEqual(component.value()[key], [{}])
         # 3) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 4) The label text should not remain empty -- it should give a warning about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
 
         # Test inputting JSON data defined in "helpers.py" and updating the component.
         # There are two positioning stacks and four positioners
-        json_data = json.loads(SAMPLE_IDF)
+        json_data = clone_fixture(SAMPLE_IDF_DATA)
 
         # This should select the first positioning stack
         component.updateValue(json_data, '')
         stack_positioners = ['Positioning Table']
         leftover_positioners = ['Huber Circle', 'incident_jaws', 'diffracted_jaws', component.add_new_text]
-        box_items = []
-        combobox_items = []
         # 1) The fields in the component should be updated to match the expected result
         self.assertEqual(component.name_combobox.currentText(), 'Positioning Table Only')
         self.assertEqual(component.positioners_combobox.currentText(), 'Huber Circle')
-        for index in range(component.positioners_combobox.count()):
-            combobox_items.append(component.positioners_combobox.itemText(index))
-        for index in range(component.positioning_stack_box.count()):
-            box_items.append(component.positioning_stack_box.item(index).text())
-        self.assertCountEqual(combobox_items, leftover_positioners)
-        self.assertCountEqual(box_items, stack_positioners)
+        self.assertCountEqual(combobox_items(component.positioners_combobox), leftover_positioners)
+        self.assertCountEqual(list_box_items(component.positioning_stack_box), stack_positioners)
         # 2) The component value should be updated to match the input
-        self.assertCountEqual(component.value()[component.key], json_data['instrument'][component.key])
+        self.assertCountEqual(component.value()[key], json_data['instrument'][key])
         # 3) The component should be declared valid -- all required arguments are specified
-        self.assertTrue(component.validate())
-        # 4) The label text should remain empty -- as the component is valid
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertComponentValid(component, labels)
 
         # If we switch positioning stack, this should be recorded in the component
         component.name_combobox.setCurrentIndex(1)
         component.name_combobox.activated.emit(1)
         stack_positioners = ['Positioning Table', 'Huber Circle']
         leftover_positioners = ['incident_jaws', 'diffracted_jaws', component.add_new_text]
-        box_items = []
-        combobox_items = []
         # 1) The fields in the component should be updated to match the expected result
         self.assertEqual(component.name_combobox.currentText(), 'Positioning Table + Huber Circle')
         self.assertEqual(component.positioners_combobox.currentText(), 'incident_jaws')
-        for index in range(component.positioners_combobox.count()):
-            combobox_items.append(component.positioners_combobox.itemText(index))
-        for index in range(component.positioning_stack_box.count()):
-            box_items.append(component.positioning_stack_box.item(index).text())
-        self.assertCountEqual(box_items, stack_positioners)
-        self.assertCountEqual(combobox_items, leftover_positioners)
+        self.assertCountEqual(list_box_items(component.positioning_stack_box), stack_positioners)
+        self.assertCountEqual(combobox_items(component.positioners_combobox), leftover_positioners)
 
         # If we use the "Add" button to add a positioner to the stack, this should be recorded in the component
         component.add_button.clicked.emit(1)
         stack_positioners = ['Positioning Table', 'Huber Circle', 'incident_jaws']
         leftover_positioners = ['diffracted_jaws', component.add_new_text]
-        box_items = []
-        combobox_items = []
         # 1) The fields in the component should be updated to match the expected result
         self.assertEqual(component.name_combobox.currentText(), 'Positioning Table + Huber Circle')
         self.assertEqual(component.positioners_combobox.currentText(), 'diffracted_jaws')
-        for index in range(component.positioners_combobox.count()):
-            combobox_items.append(component.positioners_combobox.itemText(index))
-        for index in range(component.positioning_stack_box.count()):
-            box_items.append(component.positioning_stack_box.item(index).text())
-        self.assertCountEqual(box_items, stack_positioners)
-        self.assertCountEqual(combobox_items, leftover_positioners)
+        self.assertCountEqual(list_box_items(component.positioning_stack_box), stack_positioners)
+        self.assertCountEqual(combobox_items(component.positioners_combobox), leftover_positioners)
 
         # If we use the "Add" button to add a new positioner to the stack, this should be recorded in the component
         new_positioner = 'New Positioner'
@@ -949,17 +920,11 @@ class TestEditor(unittest.TestCase):
         component.add_button.clicked.emit(1)
         stack_positioners = ['Positioning Table', 'Huber Circle', 'incident_jaws', new_positioner]
         leftover_positioners = ['diffracted_jaws', component.add_new_text]
-        box_items = []
-        combobox_items = []
         # 1) The fields in the component should be updated to match the expected result
         self.assertEqual(component.name_combobox.currentText(), 'Positioning Table + Huber Circle')
         self.assertEqual(component.positioners_combobox.currentText(), '')
-        for index in range(component.positioners_combobox.count()):
-            combobox_items.append(component.positioners_combobox.itemText(index))
-        for index in range(component.positioning_stack_box.count()):
-            box_items.append(component.positioning_stack_box.item(index).text())
-        self.assertCountEqual(box_items, stack_positioners)
-        self.assertCountEqual(combobox_items, leftover_positioners)
+        self.assertCountEqual(list_box_items(component.positioning_stack_box), stack_positioners)
+        self.assertCountEqual(combobox_items(component.positioners_combobox), leftover_positioners)
 
         # If we use the "Add" button to add an existing positioner to the stack,
         # the positioner should move to the end of the list
@@ -968,17 +933,11 @@ class TestEditor(unittest.TestCase):
         component.add_button.clicked.emit(1)
         stack_positioners = ['Positioning Table', 'incident_jaws', new_positioner, 'Huber Circle']
         leftover_positioners = ['diffracted_jaws', component.add_new_text]
-        box_items = []
-        combobox_items = []
         # 1) The fields in the component should be updated to match the expected result
         self.assertEqual(component.name_combobox.currentText(), 'Positioning Table + Huber Circle')
         self.assertEqual(component.positioners_combobox.currentText(), '')
-        for index in range(component.positioners_combobox.count()):
-            combobox_items.append(component.positioners_combobox.itemText(index))
-        for index in range(component.positioning_stack_box.count()):
-            box_items.append(component.positioning_stack_box.item(index).text())
-        self.assertCountEqual(box_items, stack_positioners)
-        self.assertCountEqual(combobox_items, leftover_positioners)
+        self.assertCountEqual(list_box_items(component.positioning_stack_box), stack_positioners)
+        self.assertCountEqual(combobox_items(component.positioners_combobox), leftover_positioners)
 
         # If we use the "Clear" button to remove positioners from the stack, this should be recorded in the component
         # but undefined positioners should not appear in the combobox
@@ -987,17 +946,11 @@ class TestEditor(unittest.TestCase):
         leftover_positioners = [
             'Positioning Table', 'Huber Circle', 'incident_jaws', 'diffracted_jaws', component.add_new_text
         ]
-        box_items = []
-        combobox_items = []
         # 1) The fields in the component should be updated to match the expected result
         self.assertEqual(component.name_combobox.currentText(), 'Positioning Table + Huber Circle')
         self.assertEqual(component.positioners_combobox.currentText(), 'Positioning Table')
-        for index in range(component.positioners_combobox.count()):
-            combobox_items.append(component.positioners_combobox.itemText(index))
-        for index in range(component.positioning_stack_box.count()):
-            box_items.append(component.positioning_stack_box.item(index).text())
-        self.assertCountEqual(box_items, stack_positioners)
-        self.assertCountEqual(combobox_items, leftover_positioners)
+        self.assertCountEqual(list_box_items(component.positioning_stack_box), stack_positioners)
+        self.assertCountEqual(combobox_items(component.positioners_combobox), leftover_positioners)
 
         # If we switch to the "Add New..." options, text fields should be cleared
         component.name_combobox.setCurrentIndex(2)
@@ -1006,13 +959,9 @@ class TestEditor(unittest.TestCase):
         self.assertEqual(component.name_combobox.currentText(), '')
         self.assertEqual(component.positioners_combobox.currentText(), 'Positioning Table')
         self.assertEqual(component.positioning_stack_box.count(), 0)
-        for label in labels:
-            self.assertEqual(label.text(), '')
+        self.assertEqual([label.text() for label in labels], [''] * len(labels))
         # 2) The component should not be declared valid -- because required arguments are not provided
-        self.assertFalse(component.validate())
-        # 3) The label text should not remain empty -- it should give a warning about the required fields
-        for label in labels:
-            self.assertNotEqual(label.text(), '')
+        self.assertComponentInvalid(component, labels)
         # 4) When adding a new positioner, the positioners combobox should be cleared
         component.positioners_combobox.setCurrentIndex(4)
         component.positioners_combobox.activated.emit(1)
@@ -1025,5 +974,4 @@ class TestEditor(unittest.TestCase):
         # 4) When adding the hardware, it should appear in the JSON
         stacks = json_data.get('instrument').get('positioning_stacks')
         new_stacks = ['Positioning Table Only', 'Positioning Table + Huber Circle', 'New stack']
-        for index, stack in enumerate(stacks):
-            self.assertEqual(stack['name'], new_stacks[index])
+        self.assertEqual([stack['name'] for stack in stacks], new_stacks)
@@ -471,16 +471,35 @@ class TestVolumeClass(unittest.TestCase):
         np.testing.assert_array_almost_equal(volume.transform_matrix, transform, decimal=5)
         self.assertEqual(volume.render_target.shape, (2, 3, 4))
 
+    def testBinFFT(self):
+        # a constant volume has no frequency content so it must bin to the same
+        # constant, the half voxel offset keeps the uint8 truncation away from
+        # integer boundaries
+        data = np.full((8, 8, 8), 64.5, np.float32)
+        volume = Volume(data, np.ones(3), np.zeros(3))
+        binned = volume.binFFT((4, 4, 4))
+        self.assertEqual(binned.shape, (4, 4, 4))
+        self.assertEqual(binned.dtype, np.uint8)
+        np.testing.assert_array_equal(binned, np.full((4, 4, 4), 64, np.uint8))
+
+        # a cosine with one cycle per axis is band limited so halving the shape in
+        # the Fourier domain must reproduce the original samples at every other voxel
+        x = np.cos(np.linspace(0, 2 * np.pi, 8, endpoint=False))
+        data = 100.5 + 25 * (x[:, None, None] + x[None, :, None] + x[None, None, :])
+        volume = Volume(data.astype(np.float32), np.ones(3), np.zeros(3))
+        binned = volume.binFFT((4, 4, 4))
+        np.testing.assert_array_equal(binned, data[::2, ::2, ::2].astype(np.uint8))
+
     def testCurve(self):
         x = np.array([30])
         y = np.array([0.5])
-        tf = np.tile(np.linspace(0.0, 1.0, num=256, dtype=np.float32)[:, None], (1, 4))
-        tf[:, 3] = 0.5
+        tf = np.tile(np.arange(256, dtype=np.uint8)[:, None], (1, 4))
+        tf[:, 3] = 128
         curve = Curve(x, y, x, Curve.Type.Cubic)
         np.testing.assert_array_equal(curve.transfer_function, tf.flatten())
         self.assertAlmostEqual(curve.evaluate([40]), 0.5)
         curve = Curve(x, y, x, Curve.Type.Linear)
-        np.testing.assert_array_almost_equal(curve.transfer_function, tf.flatten(), decimal=5)
+        np.testing.assert_array_equal(curve.transfer_function, tf.flatten())
         self.assertAlmostEqual(curve.evaluate([20]), 0.5)
 
         x = np.array([20, 200])
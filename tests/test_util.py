@@ -57,7 +57,7 @@ class TestNode(unittest.TestCase):
         )
 
         volume = Volume(np.zeros([3, 4, 5], np.float32), np.ones(3), np.array([1., 1.5, 2.]))
-        with mock.patch('sscanss.core.scene.node.Texture3D'), mock.patch('sscanss.core.scene.node.Texture1D'):
+        with mock.patch('sscanss.core.scene.node.Texture3D'), mock.patch('sscanss.core.scene.node.Texture2D'):
             node = SampleEntity(volume).node()
             np.testing.assert_array_almost_equal(node.top, [1.5, 2., 2.5])
             np.testing.assert_array_almost_equal(node.bottom, [-1.5, -2., -2.5])